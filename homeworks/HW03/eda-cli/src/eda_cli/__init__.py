@@ -5,6 +5,7 @@ from .core import (
     missing_table,
     correlation_matrix,
     compute_quality_flags,
+    detect_key_candidates,
 )
 
 __version__ = "0.1.0"
@@ -13,4 +14,5 @@ __all__ = [
     "missing_table",
     "correlation_matrix",
     "compute_quality_flags",
+    "detect_key_candidates",
 ]
@@ -1,7 +1,9 @@
 """Command-line interface for EDA CLI."""
 
+import json
 import sys
 import click
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
@@ -10,16 +12,60 @@ from .core import (
     missing_table,
     correlation_matrix,
     compute_quality_flags,
-    get_top_categories,
+    detect_key_candidates,
     get_problematic_columns,
+    load_csv,
+    read_csv_chunks,
 )
+from .inputs import STDIN
+from .streaming import RowSampler, StreamingProfiler
+from .strings import string_stats_table
+from .timeseries import profile_time_series
+from .topk import TopKCounter
 from .viz import (
     plot_histograms,
     plot_correlation_heatmap,
     plot_missing_matrix,
+    plot_time_buckets,
 )
 
 
+# Input files may be gzip/bz2/xz/zstd compressed; "-" reads standard input
+INPUT_PATH = click.Path(exists=True, dir_okay=False, allow_dash=True)
+
+
+def _stream_dataset(filepath, chunk_size, sample_rows, time_column=None, time_bucket=None,
+                    observers=()):
+    """Profile a CSV input in one pass over its chunks.
+    
+    Every chunk is also passed to the update() method of each observer.
+    
+    Returns:
+        Tuple of (StreamingProfiler, sampled rows, time-series profile or None)
+    """
+    profiler = StreamingProfiler()
+    sampler = RowSampler(sample_rows, seed=0)
+    observers = [profiler, sampler, *observers]
+    
+    def observed_chunks():
+        for chunk in read_csv_chunks(filepath, chunksize=chunk_size):
+            for observer in observers:
+                observer.update(chunk)
+            yield chunk
+    
+    chunks = observed_chunks()
+    time_profile = profile_time_series(chunks, time_column=time_column, bucket=time_bucket)
+    # Finish the pass when there is no datetime column to profile
+    for _ in chunks:
+        pass
+    return profiler, sampler.sample(), time_profile
+
+
+def _json_value(value):
+    """Convert numpy scalars to plain Python values for JSON output."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
 @click.group()
 def cli():
     """EDA CLI - Exploratory Data Analysis Command Line Interface."""
@@ -27,17 +73,37 @@ def cli():
 
 
 @cli.command()
-@click.argument("filepath", type=click.Path(exists=True))
-def overview(filepath):
+@click.argument("filepath", type=INPUT_PATH)
+@click.option(
+    "--streaming",
+    is_flag=True,
+    help="Profile in chunks with bounded memory (always on for stdin)"
+)
+@click.option(
+    "--chunk-size",
+    type=int,
+    default=100_000,
+    help="Rows per chunk for streaming"
+)
+def overview(filepath, streaming, chunk_size):
     """Display dataset overview and quality flags.
     
     Args:
-        filepath: Path to CSV file
+        filepath: Path to CSV file (optionally compressed), or - for stdin
+        streaming: Profile in chunks instead of loading the whole file
+        chunk_size: Rows per chunk for streaming
     """
     try:
-        df = pd.read_csv(filepath)
-        summary = summarize_dataset(df)
-        flags = compute_quality_flags(df)
+        if streaming or filepath == STDIN:
+            profiler = StreamingProfiler()
+            for chunk in read_csv_chunks(filepath, chunksize=chunk_size):
+                profiler.update(chunk)
+            summary = profiler.summary()
+            flags = profiler.quality_flags()
+        else:
+            df = load_csv(filepath)
+            summary = summarize_dataset(df)
+            flags = compute_quality_flags(df)
         
         click.echo("\n=== Dataset Overview ===")
         click.echo(f"Rows: {summary['n_rows']}")
@@ -59,7 +125,7 @@ def overview(filepath):
 
 
 @cli.command()
-@click.argument("filepath", type=click.Path(exists=True))
+@click.argument("filepath", type=INPUT_PATH)
 @click.option(
     "--output-dir",
     "-o",
@@ -91,19 +157,61 @@ def overview(filepath):
     default=0.1,
     help="Minimum share of missing values to highlight column"
 )
-def report(filepath, output_dir, max_hist_columns, top_k_categories, title, min_missing_share):
+@click.option(
+    "--time-column",
+    type=str,
+    default=None,
+    help="Datetime column for the time-series profile (default: first detected)"
+)
+@click.option(
+    "--time-bucket",
+    type=str,
+    default=None,
+    help="Time bucket size, e.g. 1h or 1D (default: automatic)"
+)
+@click.option(
+    "--chunk-size",
+    type=int,
+    default=100_000,
+    help="Rows per chunk for streaming stages"
+)
+@click.option(
+    "--streaming",
+    is_flag=True,
+    help="Profile in one chunked pass with bounded memory (always on for stdin)"
+)
+@click.option(
+    "--sample-rows",
+    type=int,
+    default=100_000,
+    help="Rows sampled in streaming mode for correlations, strings and plots"
+)
+@click.option(
+    "--max-categorical-columns",
+    type=int,
+    default=None,
+    help="Maximum number of categorical columns for top values (default: all)"
+)
+def report(filepath, output_dir, max_hist_columns, top_k_categories, title, min_missing_share,
+           time_column, time_bucket, chunk_size, streaming, sample_rows, max_categorical_columns):
     """Generate comprehensive EDA report with visualizations.
     
     Args:
-        filepath: Path to CSV file
+        filepath: Path to CSV file (optionally compressed), or - for stdin
         output_dir: Directory to save report files
         max_hist_columns: Maximum columns for histograms
         top_k_categories: Number of top categories to show
         title: Custom report title
         min_missing_share: Threshold for problematic columns
+        time_column: Datetime column for the time-series profile
+        time_bucket: Time bucket size
+        chunk_size: Rows per chunk for streaming stages
+        streaming: Profile in one chunked pass instead of loading the whole file
+        sample_rows: Sample size for frame-based sections in streaming mode
+        max_categorical_columns: Maximum categorical columns for top values
     """
     try:
-        df = pd.read_csv(filepath)
+        streaming = streaming or filepath == STDIN
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
@@ -111,19 +219,46 @@ def report(filepath, output_dir, max_hist_columns, top_k_categories, title, min_
         click.echo(f"Input: {filepath}")
         click.echo(f"Output: {output_dir}")
         
+        # Sketches bound the memory of high-cardinality columns while streaming
+        top_counter = TopKCounter(
+            top_k=top_k_categories,
+            max_columns=max_categorical_columns,
+            exact_limit=100_000 if streaming else None,
+        )
+        if streaming:
+            # Exact counts and sketches from one pass; df is a row sample
+            profiler, df, time_profile = _stream_dataset(
+                filepath, chunk_size, sample_rows, time_column, time_bucket,
+                observers=[top_counter],
+            )
+            summary = profiler.summary()
+            flags = profiler.quality_flags()
+            # Uniqueness cannot be judged on a sample
+            keys = pd.DataFrame()
+            missing = profiler.missing_table()
+            problematic = profiler.problematic_columns(min_missing_share)
+        else:
+            df = load_csv(filepath)
+            summary = summarize_dataset(df)
+            keys = detect_key_candidates(df)
+            flags = compute_quality_flags(df, key_candidates=keys)
+            missing = missing_table(df)
+            problematic = get_problematic_columns(df, min_missing_share)
+            top_counter.update(df)
+            time_profile = profile_time_series(df, time_column=time_column, bucket=time_bucket)
+        
         # Summary
-        summary = summarize_dataset(df)
         click.echo(f"\nDataset: {summary['n_rows']} rows × {summary['n_cols']} columns")
+        if streaming:
+            click.echo(f"Streaming: correlations, string stats and plots use a sample of {len(df)} rows")
         
         # Quality flags
-        flags = compute_quality_flags(df)
         click.echo("\n=== Quality Flags ===")
         for flag, value in flags.items():
             status = "⚠️  WARNING" if value else "✓ OK"
             click.echo(f"  {status}: {flag}")
         
         # Missing values
-        missing = missing_table(df)
         if not missing.empty:
             click.echo("\n=== Missing Values ===")
             missing_file = output_path / "missing_values.csv"
@@ -132,10 +267,24 @@ def report(filepath, output_dir, max_hist_columns, top_k_categories, title, min_
             click.echo(f"Saved to: {missing_file}")
             
             # Highlight problematic columns
-            problematic = get_problematic_columns(df, min_missing_share)
             if problematic:
                 click.echo(f"\n⚠️  Problematic columns (>{min_missing_share*100}% missing): {', '.join(problematic)}")
         
+        # Key candidates
+        if not keys.empty:
+            click.echo("\n=== Key Candidates ===")
+            keys_file = output_path / "key_candidates.csv"
+            keys = keys.assign(columns=keys["columns"].map(lambda cols: " + ".join(map(str, cols))))
+            keys.to_csv(keys_file, index=False)
+            for _, row in keys.iterrows():
+                status = "unique" if row["is_unique"] else "duplicates"
+                source = "exact" if row["exact"] else "estimated"
+                click.echo(
+                    f"  {row['columns']}: {status}, "
+                    f"uniqueness {row['uniqueness_ratio']:.3f} ({source})"
+                )
+            click.echo(f"Saved to: {keys_file}")
+        
         # Correlation matrix
         corr = correlation_matrix(df)
         if not corr.empty:
@@ -144,16 +293,76 @@ def report(filepath, output_dir, max_hist_columns, top_k_categories, title, min_
             corr.to_csv(corr_file)
             click.echo(f"Saved to: {corr_file}")
         
-        # Categorical top values
-        categorical_cols = df.select_dtypes(include=['object', 'category']).columns
-        if len(categorical_cols) > 0:
+        # String column statistics
+        string_stats = string_stats_table(df)
+        if not string_stats.empty:
+            click.echo("\n=== String Columns ===")
+            string_file = output_path / "string_stats.csv"
+            string_stats.to_csv(string_file, index=False)
+            for _, row in string_stats.iterrows():
+                classes = ", ".join(
+                    f"{name} {100 * row[f'{name}_share']:.1f}%"
+                    for name in ("empty", "whitespace", "numeric", "email", "uuid")
+                    if row[f"{name}_share"] > 0
+                )
+                mixed = " ⚠️  mixed types" if row["mixed_types"] else ""
+                click.echo(
+                    f"  {row['column']}: length {row['min_length']}–{row['max_length']} "
+                    f"(median {row['median_length']}, p95 {row['p95_length']})"
+                    f"{'; ' + classes if classes else ''}{mixed}"
+                )
+            click.echo(f"Saved to: {string_file}")
+        
+        # Categorical top values (all rows, also in streaming mode)
+        top_values = top_counter.result()
+        if top_values:
             click.echo(f"\n=== Top {top_k_categories} Category Values ===")
-            for col in categorical_cols[:5]:  # Show first 5 categorical columns
-                top_vals = get_top_categories(df, col, top_k_categories)
-                click.echo(f"\n{col}:")
-                for val, count in top_vals:
-                    pct = 100 * count / len(df)
+            n_rows = summary["n_rows"]
+            for col, top in top_values.items():
+                note = "" if top["exact"] else f" (approximate, ±{top['error_bound']})"
+                click.echo(f"\n{col}:{note}")
+                for val, count in top["values"]:
+                    pct = 100 * count / n_rows
                     click.echo(f"  {val}: {count} ({pct:.1f}%)")
+            top_file = output_path / "top_categories.json"
+            with open(top_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        col: {
+                            **top,
+                            "values": [
+                                {"value": _json_value(val), "count": count}
+                                for val, count in top["values"]
+                            ],
+                        }
+                        for col, top in top_values.items()
+                    },
+                    f,
+                    indent=2,
+                    ensure_ascii=False,
+                    default=str,
+                )
+            click.echo(f"\nSaved to: {top_file}")
+        
+        # Time-series profile (all rows, also in streaming mode)
+        if time_profile is not None:
+            click.echo(f"\n=== Time Series: {time_profile['time_column']} ===")
+            click.echo(f"Range: {time_profile['start']} — {time_profile['end']}")
+            click.echo(f"Bucket: {time_profile['bucket']} ({len(time_profile['buckets'])} buckets)")
+            click.echo(f"Null timestamps: {time_profile['n_null_timestamps']}")
+            gaps = time_profile["gaps"]
+            click.echo(f"Gaps: {len(gaps)} ({int(gaps['missing_buckets'].sum())} empty buckets)")
+            click.echo(
+                f"Out-of-order rows: {time_profile['n_out_of_order']} "
+                f"in {time_profile['n_out_of_order_spans']} spans"
+            )
+            buckets_file = output_path / "time_buckets.csv"
+            time_profile["buckets"].to_csv(buckets_file)
+            click.echo(f"Saved to: {buckets_file}")
+            if not gaps.empty:
+                gaps_file = output_path / "time_gaps.csv"
+                gaps.to_csv(gaps_file, index=False)
+                click.echo(f"Saved to: {gaps_file}")
         
         # Visualizations
         click.echo("\n=== Generating Visualizations ===")
@@ -172,6 +381,11 @@ def report(filepath, output_dir, max_hist_columns, top_k_categories, title, min_
             plot_missing_matrix(df, str(missing_plot))
             click.echo(f"  ✓ Missing values matrix: {missing_plot}")
         
+        if time_profile is not None:
+            time_plot = output_path / "time_series.png"
+            plot_time_buckets(time_profile["buckets"], str(time_plot), gaps=time_profile["gaps"])
+            click.echo(f"  ✓ Time series profile: {time_plot}")
+        
         click.echo(f"\n✅ Report generated successfully in: {output_dir}")
         
     except Exception as e:
@@ -180,7 +394,7 @@ def report(filepath, output_dir, max_hist_columns, top_k_categories, title, min_
 
 
 @cli.command()
-@click.argument("filepath", type=click.Path(exists=True))
+@click.argument("filepath", type=INPUT_PATH)
 @click.option(
     "--n",
     type=int,
@@ -191,11 +405,11 @@ def head(filepath, n):
     """Display first N rows of the dataset.
     
     Args:
-        filepath: Path to CSV file
+        filepath: Path to CSV file (optionally compressed), or - for stdin
         n: Number of rows to display (default: 5)
     """
     try:
-        df = pd.read_csv(filepath)
+        df = load_csv(filepath, nrows=n)
         click.echo(f"\n=== First {n} rows ===")
         click.echo(df.head(n).to_string())
         
@@ -205,7 +419,7 @@ def head(filepath, n):
 
 
 @cli.command()
-@click.argument("filepath", type=click.Path(exists=True))
+@click.argument("filepath", type=INPUT_PATH)
 @click.option(
     "--n",
     type=int,
@@ -218,17 +432,29 @@ def head(filepath, n):
     default=None,
     help="Random seed for reproducibility"
 )
-def sample(filepath, n, seed):
+@click.option(
+    "--chunk-size",
+    type=int,
+    default=100_000,
+    help="Rows per chunk while sampling"
+)
+def sample(filepath, n, seed, chunk_size):
     """Display random N rows from the dataset.
     
+    Rows are sampled while reading in chunks, so only N rows are kept
+    in memory.
+    
     Args:
-        filepath: Path to CSV file
+        filepath: Path to CSV file (optionally compressed), or - for stdin
         n: Number of rows to sample (default: 5)
         seed: Random seed for reproducibility
+        chunk_size: Rows per chunk while sampling
     """
     try:
-        df = pd.read_csv(filepath)
-        sampled = df.sample(n=min(n, len(df)), random_state=seed)
+        sampler = RowSampler(n, seed=seed)
+        for chunk in read_csv_chunks(filepath, chunksize=chunk_size):
+            sampler.update(chunk)
+        sampled = sampler.sample()
         
         click.echo(f"\n=== Random sample of {n} rows ===")
         if seed is not None:
@@ -1,8 +1,190 @@
 """Core functions for EDA CLI."""
 
+import re
+import warnings
+
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from .inputs import open_input
+from .sketches import hash_column, combine_hashes, hll_estimate
+from .topk import categorical_columns
+
+
+# Name tokens that mark a column as a likely identifier
+ID_NAME_TOKENS = {"id", "ids", "uuid", "guid", "key", "pk"}
+
+# Suffixes that mark a one-word name such as "userid" as an identifier
+ID_NAME_SUFFIXES = ("id", "ids", "key")
+
+# Words that end in an ID suffix but are not identifiers
+ID_NAME_EXCLUDED = {
+    "android", "asteroid", "avoid", "braid", "candid", "druid", "fluid",
+    "humanoid", "humid", "hybrid", "invalid", "liquid", "lucid", "morbid",
+    "orchid", "paid", "placid", "postpaid", "prepaid", "pyramid", "rapid",
+    "rigid", "solid", "splendid", "squid", "steroid", "stupid", "tabloid",
+    "thyroid", "timid", "unpaid", "valid", "vivid",
+    "donkey", "hockey", "jockey", "monkey", "turkey", "whiskey",
+}
+
+# Leading non-null values checked for duplicates before a column is hashed
+KEY_PROBE_ROWS = 1000
+
+# Strings that may hold a date: a digit and a date/time separator
+DATETIME_PATTERN = r"\d.*[-/:]|[-/:].*\d"
+
+# strftime directives that make up a full date (year, month and day)
+DATE_DIRECTIVES = [("%Y", "%y"), ("%m", "%b", "%B"), ("%d",)]
+
+
+def _parse_datetime(series: pd.Series, fmt: str) -> pd.Series:
+    """Parse strings as datetimes, turning unparseable values into NaT."""
+    return pd.to_datetime(series, errors="coerce", format=fmt)
+
+
+def _has_full_date(fmt: Optional[str]) -> bool:
+    """Check whether a strftime format has a year, a month and a day."""
+    return fmt is not None and all(
+        any(directive in fmt for directive in group) for group in DATE_DIRECTIVES
+    )
+
+
+def _guess_formats(value: str) -> List[str]:
+    """Candidate full-date formats of a value, month-first before day-first."""
+    formats = []
+    with warnings.catch_warnings():
+        # Silence the warnings about guesses that disagree with dayfirst
+        warnings.simplefilter("ignore", UserWarning)
+        for dayfirst in (False, True):
+            fmt = pd.tseries.api.guess_datetime_format(value, dayfirst=dayfirst)
+            if _has_full_date(fmt) and fmt not in formats:
+                formats.append(fmt)
+    return formats
+
+
+def detect_datetime_columns(
+    df: pd.DataFrame,
+    sample_size: int = 1000,
+    min_parse_share: float = 0.95
+) -> Dict[str, str]:
+    """Detect string columns that hold dates or timestamps.
+    
+    The format is guessed from the first non-null value of each string
+    column and must contain a full date, so times of day and fractions
+    such as "1/2" are left alone. The first sample_size non-null values
+    are parsed with each guess (month-first before day-first) and the
+    format parsing the most values wins. ISO 8601 strings whose exact
+    format varies between rows fall back to "ISO8601".
+    
+    Args:
+        df: Input DataFrame
+        sample_size: Number of non-null values to test per column
+        min_parse_share: Minimum share of sampled values that must parse
+        
+    Returns:
+        Dictionary mapping column name to a concrete datetime format,
+        to be applied to all rows (and every chunk) of the column
+    """
+    formats = {}
+    for col in df.columns:
+        series = df[col]
+        if not pd.api.types.is_string_dtype(series):
+            continue
+        sample = series.dropna().head(sample_size).astype(str)
+        if sample.empty:
+            continue
+        if sample.str.contains(DATETIME_PATTERN).mean() < min_parse_share:
+            continue
+        candidates = _guess_formats(sample.iloc[0])
+        if candidates and candidates[0].startswith("%Y-%m-%d"):
+            candidates.append("ISO8601")
+        best_fmt, best_share = None, 0.0
+        for fmt in candidates:
+            try:
+                share = _parse_datetime(sample, fmt).notna().mean()
+            except (ValueError, TypeError):
+                continue
+            if share > best_share:
+                best_fmt, best_share = fmt, share
+        if best_fmt is not None and best_share >= min_parse_share:
+            formats[col] = best_fmt
+    return formats
+
+
+def parse_datetime_columns(
+    df: pd.DataFrame,
+    formats: Dict[str, str]
+) -> pd.DataFrame:
+    """Convert detected datetime columns in place.
+    
+    Args:
+        df: Input DataFrame
+        formats: Mapping from detect_datetime_columns
+        
+    Returns:
+        The same DataFrame with datetime64 columns
+    """
+    for col, fmt in formats.items():
+        if col not in df.columns or pd.api.types.is_datetime64_any_dtype(df[col]):
+            continue
+        try:
+            df[col] = _parse_datetime(df[col], fmt)
+        except (ValueError, TypeError):
+            # Mixed time zones and similar: keep the original strings
+            continue
+    return df
+
+
+def load_csv(
+    filepath: str,
+    parse_dates: bool = True,
+    nrows: Optional[int] = None
+) -> pd.DataFrame:
+    """Load a CSV file, converting timestamp columns to datetime64.
+    
+    Args:
+        filepath: Path to CSV file (optionally compressed), or "-" for stdin
+        parse_dates: Whether to detect and parse datetime columns
+        nrows: Number of rows to read (default: all)
+        
+    Returns:
+        Loaded DataFrame
+    """
+    with open_input(filepath) as stream:
+        df = pd.read_csv(stream, nrows=nrows)
+    if parse_dates:
+        parse_datetime_columns(df, detect_datetime_columns(df))
+    return df
+
+
+def read_csv_chunks(
+    filepath: str,
+    chunksize: int = 100_000,
+    parse_dates: bool = True
+) -> Iterator[pd.DataFrame]:
+    """Read a CSV file in chunks, converting timestamp columns to datetime64.
+    
+    Datetime columns and their formats are detected on the first chunk;
+    the same concrete format strings are applied to every following
+    chunk, so ambiguous dates keep one meaning throughout the file.
+    
+    Args:
+        filepath: Path to CSV file (optionally compressed), or "-" for stdin
+        chunksize: Number of rows per chunk
+        parse_dates: Whether to detect and parse datetime columns
+        
+    Yields:
+        DataFrame chunks
+    """
+    formats = None
+    with open_input(filepath) as stream, pd.read_csv(stream, chunksize=chunksize) as reader:
+        for chunk in reader:
+            if parse_dates:
+                if formats is None:
+                    formats = detect_datetime_columns(chunk)
+                parse_datetime_columns(chunk, formats)
+            yield chunk
 
 
 def summarize_dataset(df: pd.DataFrame) -> Dict[str, Any]:
@@ -69,7 +251,8 @@ def compute_quality_flags(
     df: pd.DataFrame,
     missing_threshold: float = 0.5,
     cardinality_threshold: float = 0.5,
-    zero_threshold: float = 0.3
+    zero_threshold: float = 0.3,
+    key_candidates: Optional[pd.DataFrame] = None
 ) -> Dict[str, bool]:
     """Compute data quality flags based on heuristics.
     
@@ -78,6 +261,8 @@ def compute_quality_flags(
         missing_threshold: Threshold for high missing values (default: 0.5)
         cardinality_threshold: Threshold for high cardinality categoricals (default: 0.5)
         zero_threshold: Threshold for many zero values (default: 0.3)
+        key_candidates: Result of detect_key_candidates(df) to reuse
+            (default: ID-like columns are checked here)
         
     Returns:
         Dictionary with boolean flags for quality issues
@@ -96,7 +281,7 @@ def compute_quality_flags(
     
     # NEW FLAG 2: High cardinality categoricals
     # Check object/category columns with more than cardinality_threshold unique values
-    categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+    categorical_cols = categorical_columns(df)
     high_cardinality = False
     for col in categorical_cols:
         unique_ratio = df[col].nunique() / len(df)
@@ -106,15 +291,13 @@ def compute_quality_flags(
     flags["has_high_cardinality_categoricals"] = high_cardinality
     
     # NEW FLAG 3: Suspicious ID duplicates
-    # Look for columns that look like IDs (name contains 'id', '_id', 'ID') with duplicates
-    suspicious_id_duplicates = False
-    for col in df.columns:
-        col_lower = col.lower()
-        if 'id' in col_lower or col.endswith('_id') or col.endswith('ID'):
-            if df[col].duplicated().any():
-                suspicious_id_duplicates = True
-                break
-    flags["has_suspicious_id_duplicates"] = suspicious_id_duplicates
+    # Key-like columns (by name) whose values are not unique
+    if key_candidates is None:
+        key_candidates = detect_key_candidates(df, id_columns_only=True)
+    single = key_candidates[key_candidates["kind"] == "single"]
+    flags["has_suspicious_id_duplicates"] = bool(
+        (single["name_hint"] & ~single["is_unique"]).any()
+    )
     
     # NEW FLAG 4: Many zero values in numeric columns
     numeric_cols = df.select_dtypes(include=[np.number]).columns
@@ -126,7 +309,210 @@ def compute_quality_flags(
             break
     flags["has_many_zero_values"] = many_zeros
     
-    return flags
+    return {name: bool(value) for name, value in flags.items()}
+
+
+def _name_tokens(column: Any) -> List[str]:
+    """Split a column name into lower-case words (snake_case and camelCase)."""
+    return [
+        token.lower()
+        for token in re.findall(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+", str(column))
+    ]
+
+
+def _is_id_token(token: str) -> bool:
+    """Check whether a lower-case word names an identifier."""
+    if token in ID_NAME_TOKENS:
+        return True
+    singular = token[:-1] if token.endswith("s") else token
+    if token in ID_NAME_EXCLUDED or singular in ID_NAME_EXCLUDED:
+        return False
+    return any(
+        token.endswith(suffix) and len(token) - len(suffix) >= 3
+        for suffix in ID_NAME_SUFFIXES
+    )
+
+
+def looks_like_id(column: Any) -> bool:
+    """Check whether a column name contains an identifier word.
+    
+    Args:
+        column: Column name (snake_case and camelCase are split into words)
+        
+    Returns:
+        True if a word of the name is in ID_NAME_TOKENS, or is a word such
+        as "userid" that ends in an ID suffix and is not in ID_NAME_EXCLUDED
+    """
+    return any(_is_id_token(token) for token in _name_tokens(column))
+
+
+def is_key_dtype(dtype: Any, name_hint: bool) -> bool:
+    """Check whether a column dtype can hold key values.
+    
+    Args:
+        dtype: Column dtype
+        name_hint: Whether the column name looks like an ID; float columns
+            are accepted only then
+        
+    Returns:
+        True for integer, string and category dtypes (and hinted floats)
+    """
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_datetime64_any_dtype(dtype):
+        return False
+    if pd.api.types.is_float_dtype(dtype):
+        # Integer IDs become float when the column has missing values
+        return name_hint
+    return (
+        pd.api.types.is_integer_dtype(dtype)
+        or pd.api.types.is_string_dtype(dtype)
+        or isinstance(dtype, pd.CategoricalDtype)
+    )
+
+
+def _is_strictly_increasing(series: pd.Series) -> bool:
+    """Check if a numeric column without missing values is strictly increasing."""
+    if not pd.api.types.is_numeric_dtype(series) or series.hasnans:
+        return False
+    values = series.to_numpy()
+    return bool(np.all(values[1:] > values[:-1]))
+
+
+def _has_cheap_duplicates(values: pd.Series) -> bool:
+    """Prove duplicates among non-null values without hashing the column."""
+    if pd.api.types.is_integer_dtype(values.dtype):
+        # Fewer possible integers than values
+        if int(values.max()) - int(values.min()) + 1 < len(values):
+            return True
+    return bool(values.iloc[:KEY_PROBE_ROWS].duplicated().any())
+
+
+def detect_key_candidates(
+    df: pd.DataFrame,
+    min_unique_ratio: float = 0.95,
+    tolerance: float = 0.1,
+    max_pair_columns: int = 20,
+    id_columns_only: bool = False
+) -> pd.DataFrame:
+    """Detect columns and column pairs that look like keys.
+    
+    Columns are screened by name, dtype, monotonicity, cheap duplicate
+    checks (integer range, duplicates among the first values) and a
+    HyperLogLog estimate of the distinct count. Columns without an ID-like
+    name that fail the cheap checks are hashed only when a pair search
+    needs them. Exact uniqueness checks run only on
+    candidates whose estimate is close to the row count; pairs are checked
+    on combined 64-bit hashes. Uniqueness is measured over the non-null
+    values of a column.
+    
+    Args:
+        df: Input DataFrame
+        min_unique_ratio: Estimated unique ratio for a column without an
+            ID-like name to be checked; such columns are reported only if
+            they are exactly unique (default: 0.95)
+        tolerance: Estimated unique ratio below 1 - tolerance is taken as
+            proof of duplicates without an exact check (default: 0.1)
+        max_pair_columns: Maximum number of columns used to build pairs
+        id_columns_only: Check only columns with an ID-like name and skip
+            the pair search (default: False)
+        
+    Returns:
+        DataFrame with columns: columns, kind, name_hint, monotonic,
+        uniqueness_ratio, exact, is_unique
+    """
+    result_columns = [
+        "columns", "kind", "name_hint", "monotonic",
+        "uniqueness_ratio", "exact", "is_unique",
+    ]
+    n_rows = len(df)
+    if n_rows == 0:
+        return pd.DataFrame(columns=result_columns)
+    
+    rows = []
+    hashes = {}
+    estimates = {}
+    
+    def sketch(col):
+        not_null = df[col].notna().to_numpy()
+        hashes[col] = hash_column(df[col])
+        estimates[col] = min(hll_estimate(hashes[col][not_null]), int(not_null.sum()))
+    
+    deferred = []
+    for col in df.columns:
+        series = df[col]
+        name_hint = looks_like_id(col)
+        if id_columns_only and not name_hint:
+            continue
+        if not is_key_dtype(series.dtype, name_hint):
+            continue
+        
+        # Sorted sequences are unique without hashing
+        if _is_strictly_increasing(series):
+            rows.append({
+                "columns": (col,), "kind": "single", "name_hint": name_hint,
+                "monotonic": True, "uniqueness_ratio": 1.0,
+                "exact": True, "is_unique": True,
+            })
+            continue
+        
+        values = series.dropna()
+        if values.empty:
+            continue
+        # Other columns proven non-unique cheaply are only hashed for pairs
+        if not name_hint and _has_cheap_duplicates(values):
+            deferred.append(col)
+            continue
+        sketch(col)
+        ratio = estimates[col] / len(values)
+        if not name_hint and ratio < min_unique_ratio:
+            continue
+        
+        exact = ratio >= 1 - tolerance
+        if exact:
+            n_duplicates = int(values.duplicated().sum())
+            ratio = (len(values) - n_duplicates) / len(values)
+            is_unique = n_duplicates == 0
+        else:
+            is_unique = False
+        if not name_hint and not is_unique:
+            continue
+        rows.append({
+            "columns": (col,), "kind": "single", "name_hint": name_hint,
+            "monotonic": False, "uniqueness_ratio": ratio,
+            "exact": exact, "is_unique": is_unique,
+        })
+    
+    # Composite keys: pairs with at least one non-unique ID-like column
+    # that could jointly cover every row
+    unique_cols = {row["columns"][0] for row in rows if row["is_unique"]}
+    if id_columns_only or not any(
+        looks_like_id(col) and col not in unique_cols for col in estimates
+    ):
+        return pd.DataFrame(rows, columns=result_columns)
+    for col in deferred:
+        sketch(col)
+    pair_cols = sorted(
+        (col for col in estimates if col not in unique_cols),
+        key=lambda col: estimates[col],
+        reverse=True,
+    )[:max_pair_columns]
+    for i, left in enumerate(pair_cols):
+        for right in pair_cols[i + 1:]:
+            if not (looks_like_id(left) or looks_like_id(right)):
+                continue
+            if estimates[left] * estimates[right] < n_rows * (1 - tolerance):
+                continue
+            combined = combine_hashes(hashes[left], hashes[right])
+            if hll_estimate(combined) / n_rows < 1 - tolerance:
+                continue
+            n_duplicates = int(pd.Series(combined).duplicated().sum())
+            if n_duplicates == 0:
+                rows.append({
+                    "columns": (left, right), "kind": "composite",
+                    "name_hint": True, "monotonic": False,
+                    "uniqueness_ratio": 1.0, "exact": True, "is_unique": True,
+                })
+    
+    return pd.DataFrame(rows, columns=result_columns)
 
 
 def get_top_categories(
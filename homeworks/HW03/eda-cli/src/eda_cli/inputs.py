@@ -0,0 +1,221 @@
+"""Input streams for EDA CLI: plain files, stdin and compressed data."""
+
+import bz2
+import gzip
+import io
+import lzma
+import queue
+import sys
+import threading
+import zipfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional
+
+
+# Path that selects standard input
+STDIN = "-"
+
+# Leading bytes of each supported compression format
+COMPRESSION_MAGIC = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+    "zstd": b"\x28\xb5\x2f\xfd",
+    "zip": b"PK\x03\x04",
+}
+
+# Leading bytes needed to tell every format apart
+MAGIC_BYTES = max(len(magic) for magic in COMPRESSION_MAGIC.values())
+
+
+def detect_compression(head: bytes) -> Optional[str]:
+    """Detect the compression format from the first bytes of a stream.
+
+    Args:
+        head: First bytes of the stream (at least 6 for xz)
+
+    Returns:
+        "gzip", "bz2", "xz", "zstd", "zip" or None for uncompressed data
+    """
+    for name, magic in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def _open_zstd(stream: BinaryIO) -> BinaryIO:
+    """Open a zstd decompression stream with whichever library is available."""
+    try:
+        import zstandard
+    except ImportError:
+        zstandard = None
+    if zstandard is not None:
+        return zstandard.ZstdDecompressor().stream_reader(
+            stream, read_across_frames=True, closefd=False
+        )
+    try:
+        from compression import zstd  # Python 3.14+
+    except ImportError:
+        raise ImportError(
+            "Reading zstd input requires the 'zstandard' package "
+            "(pip install \"eda-cli[zstd]\")"
+        ) from None
+    return zstd.ZstdFile(stream)
+
+
+def _open_zip(stream: BinaryIO) -> BinaryIO:
+    """Open the single file of a zip archive, as pandas does for .zip paths."""
+    if not stream.seekable():
+        # The zip directory is at the end: piped archives are buffered
+        stream = io.BytesIO(stream.read())
+    archive = zipfile.ZipFile(stream)
+    names = [
+        name for name in archive.namelist()
+        if not name.startswith("__MACOSX/") and not name.endswith("/")
+    ]
+    if len(names) != 1:
+        raise ValueError(f"Zip input must contain exactly one file, found {len(names)}")
+    return archive.open(names[0])
+
+
+def _decompress(stream: BinaryIO, compression: Optional[str]) -> BinaryIO:
+    """Wrap a binary stream in a streaming decompressor."""
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=stream)
+    if compression == "bz2":
+        return bz2.BZ2File(stream)
+    if compression == "xz":
+        return lzma.LZMAFile(stream)
+    if compression == "zstd":
+        return _open_zstd(stream)
+    if compression == "zip":
+        return _open_zip(stream)
+    return stream
+
+
+class ReadAheadReader(io.RawIOBase):
+    """Read a stream from a background thread into a bounded queue.
+
+    Decompressors release the GIL, so decoding the next blocks overlaps
+    with CSV parsing in the main thread. At most max_blocks blocks of
+    block_size bytes are held in memory.
+
+    Args:
+        source: Binary stream to read from
+        block_size: Bytes per read from the source
+        max_blocks: Maximum number of blocks waiting in the queue
+    """
+
+    def __init__(self, source: BinaryIO, block_size: int = 1 << 20, max_blocks: int = 4):
+        super().__init__()
+        self._source = source
+        self._queue = queue.Queue(max_blocks)
+        self._stopped = threading.Event()
+        self._buffer = memoryview(b"")
+        self._done = False
+        self._thread = threading.Thread(target=self._produce, args=(block_size,), daemon=True)
+        self._thread.start()
+
+    def _produce(self, block_size: int) -> None:
+        try:
+            while not self._stopped.is_set():
+                block = self._source.read(block_size)
+                self._put(block)
+                if not block:
+                    return
+        except Exception as exc:
+            self._put(exc)
+
+    def _put(self, item) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer and not self._done:
+            item = self._queue.get()
+            if isinstance(item, Exception):
+                self._done = True
+                raise item
+            if not item:
+                self._done = True
+            else:
+                self._buffer = memoryview(item)
+        n = min(len(buffer), len(self._buffer))
+        buffer[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stopped.set()
+            self._thread.join()
+            self._source.close()
+        super().close()
+
+
+class _PrefixedReader(io.RawIOBase):
+    """Return bytes already read from a stream, then the rest of it.
+
+    Args:
+        head: Leading bytes taken from source
+        source: Binary stream positioned after head
+    """
+
+    def __init__(self, head: bytes, source: BinaryIO):
+        super().__init__()
+        self._head = memoryview(head)
+        self._source = source
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._head:
+            n = min(len(buffer), len(self._head))
+            buffer[:n] = self._head[:n]
+            self._head = self._head[n:]
+            return n
+        return self._source.readinto(buffer)
+
+
+@contextmanager
+def open_input(filepath: str, read_ahead: bool = True) -> Iterator[BinaryIO]:
+    """Open a file or stdin as a binary stream, decompressing on the fly.
+
+    The compression format is detected from the leading bytes, so it
+    works for piped data and does not depend on the file extension.
+
+    Args:
+        filepath: Path to the input file, or "-" for standard input
+        read_ahead: Decompress in a background thread (default: True)
+
+    Yields:
+        Readable binary stream of uncompressed data
+    """
+    raw = sys.stdin.buffer if filepath == STDIN else open(filepath, "rb")
+    stream = raw
+    try:
+        # read() waits for all bytes, peek() may return a short pipe read
+        head = raw.read(MAGIC_BYTES)
+        if raw.seekable():
+            raw.seek(0)
+        else:
+            stream = io.BufferedReader(_PrefixedReader(head, raw))
+        compression = detect_compression(head)
+        if compression is not None:
+            stream = _decompress(stream, compression)
+            if read_ahead:
+                stream = io.BufferedReader(ReadAheadReader(stream))
+        yield stream
+    finally:
+        if stream is not raw:
+            stream.close()
+        if filepath != STDIN:
+            raw.close()
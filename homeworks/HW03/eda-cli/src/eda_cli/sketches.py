@@ -0,0 +1,173 @@
+"""Probabilistic sketches used by EDA CLI for cheap column statistics."""
+
+import pandas as pd
+import numpy as np
+from typing import List, Optional
+
+
+# Multiplier used to mix two 64-bit hashes into one (golden ratio constant)
+_HASH_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+# Leading rows used to guess whether a string column has many distinct values
+HASH_PROBE_ROWS = 1000
+
+
+def hash_column(series: pd.Series) -> np.ndarray:
+    """Hash every value of a column into a 64-bit integer.
+
+    Args:
+        series: Input column
+
+    Returns:
+        Array of uint64 hashes, one per row
+    """
+    if pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype):
+        # Hashing factorizes strings first, which pays off for repeated
+        # values but dominates the cost for high-cardinality columns;
+        # both ways give the same hashes
+        probe = series.iloc[:HASH_PROBE_ROWS]
+        if probe.nunique(dropna=False) > len(probe) / 2:
+            return pd.util.hash_array(series.to_numpy(dtype=object), categorize=False)
+    return pd.util.hash_pandas_object(series, index=False).to_numpy()
+
+
+def combine_hashes(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Combine two hash arrays into hashes of the value pairs.
+
+    Args:
+        left: uint64 hashes of the first column
+        right: uint64 hashes of the second column
+
+    Returns:
+        Array of uint64 hashes of (left, right) combinations
+    """
+    with np.errstate(over="ignore"):
+        return (left * _HASH_MIX) ^ (right + (left >> np.uint64(29)))
+
+
+def hll_registers(hashes: np.ndarray, precision: int = 12) -> np.ndarray:
+    """Build HyperLogLog registers from hashed values.
+
+    Args:
+        hashes: uint64 hashes of the values
+        precision: Number of index bits, 2**precision registers (default: 12)
+
+    Returns:
+        Array of uint8 registers; registers of two sketches merge with np.maximum
+    """
+    registers = np.zeros(1 << precision, dtype=np.uint8)
+    if len(hashes) == 0:
+        return registers
+
+    index = (hashes >> np.uint64(64 - precision)).astype(np.intp)
+
+    # Rank = position of the first set bit in the top 32 of the remaining bits
+    rest = ((hashes << np.uint64(precision)) >> np.uint64(32)).astype(np.float64)
+    _, bit_length = np.frexp(rest)
+    rank = (33 - bit_length).astype(np.uint8)
+
+    np.maximum.at(registers, index, rank)
+    return registers
+
+
+def hll_count(registers: np.ndarray) -> float:
+    """Estimate the number of distinct values from HyperLogLog registers.
+
+    Args:
+        registers: Registers from hll_registers
+
+    Returns:
+        Estimated number of distinct hashes
+    """
+    m = len(registers)
+    zeros = int(np.count_nonzero(registers == 0))
+    if zeros == m:
+        return 0.0
+
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.exp2(-registers.astype(np.float64)))
+
+    # Small range correction (linear counting)
+    if estimate <= 2.5 * m and zeros > 0:
+        estimate = m * np.log(m / zeros)
+
+    return float(estimate)
+
+
+def hll_estimate(hashes: np.ndarray, precision: int = 12) -> float:
+    """Estimate the number of distinct values with a HyperLogLog sketch.
+
+    Args:
+        hashes: uint64 hashes of the values
+        precision: Number of index bits, 2**precision registers (default: 12)
+
+    Returns:
+        Estimated number of distinct hashes
+    """
+    return hll_count(hll_registers(hashes, precision))
+
+
+class CountMinSketch:
+    """Count-Min sketch over 64-bit hashes for approximate value counts.
+
+    Counts are never underestimated; the overestimate is at most
+    e * total / width with probability 1 - exp(-depth).
+
+    Args:
+        width_bits: log2 of the number of counters per row (default: 14)
+        depth: Number of hash rows (default: 4)
+    """
+
+    # Odd multipliers that derive one row index per hash row
+    _MULTIPLIERS = np.array([
+        0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9,
+        0xD6E8FEB86659FD93, 0xFF51AFD7ED558CCD, 0xC4CEB9FE1A85EC53,
+    ], dtype=np.uint64)
+
+    def __init__(self, width_bits: int = 14, depth: int = 4):
+        if depth > len(self._MULTIPLIERS):
+            raise ValueError(f"depth must be at most {len(self._MULTIPLIERS)}")
+        self.width_bits = width_bits
+        self.depth = depth
+        self.table = np.zeros((depth, 1 << width_bits), dtype=np.int64)
+        self.total = 0
+
+    @property
+    def error_bound(self) -> int:
+        """Maximum overestimate of any count (with high probability)."""
+        return int(np.e * self.total / self.table.shape[1])
+
+    def _indices(self, hashes: np.ndarray) -> List[np.ndarray]:
+        shift = np.uint64(64 - self.width_bits)
+        with np.errstate(over="ignore"):
+            return [
+                ((hashes * multiplier) >> shift).astype(np.intp)
+                for multiplier in self._MULTIPLIERS[:self.depth]
+            ]
+
+    def add(self, hashes: np.ndarray, counts: Optional[np.ndarray] = None) -> None:
+        """Add hashed values, each once or counts times.
+
+        Args:
+            hashes: uint64 hashes of the values
+            counts: Optional number of occurrences per hash
+        """
+        width = self.table.shape[1]
+        self.total += len(hashes) if counts is None else int(np.sum(counts))
+        for row, index in enumerate(self._indices(hashes)):
+            self.table[row] += np.bincount(index, weights=counts, minlength=width).astype(np.int64)
+
+    def estimate(self, hashes: np.ndarray) -> np.ndarray:
+        """Estimated counts of hashed values.
+
+        Args:
+            hashes: uint64 hashes of the values
+
+        Returns:
+            int64 array of estimated counts
+        """
+        estimates = None
+        for row, index in enumerate(self._indices(hashes)):
+            values = self.table[row][index]
+            estimates = values if estimates is None else np.minimum(estimates, values)
+        return estimates
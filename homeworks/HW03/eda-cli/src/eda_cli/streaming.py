@@ -0,0 +1,243 @@
+"""Single-pass profiling of chunked input with bounded memory."""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, List, Optional
+
+from .core import is_key_dtype, looks_like_id
+from .sketches import hash_column, hll_count, hll_registers
+
+
+def _combine_dtypes(left: Optional[np.dtype], right: np.dtype) -> np.dtype:
+    """Common dtype of a column whose type was inferred per chunk."""
+    if left is None or left == right:
+        return right
+    if pd.api.types.is_numeric_dtype(left) and pd.api.types.is_numeric_dtype(right):
+        try:
+            return np.result_type(left, right)
+        except TypeError:
+            pass
+    return np.dtype(object)
+
+
+def _hashable(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Chunk with numeric columns as float64 for hashing.
+
+    read_csv infers dtypes per chunk, so an integer column becomes float64
+    in chunks with missing values; a common dtype keeps equal values at
+    equal hashes across chunks.
+    """
+    numeric = {
+        col: np.float64 for col, dtype in chunk.dtypes.items()
+        if pd.api.types.is_numeric_dtype(dtype) and dtype != np.float64
+    }
+    return chunk.astype(numeric) if numeric else chunk
+
+
+class StreamingProfiler:
+    """Accumulate summary, missing values and quality flags chunk by chunk.
+
+    Counts of rows, missing values and zeros are exact. Distinct counts
+    (constant and high cardinality columns, duplicate rows and ID
+    duplicates) come from HyperLogLog sketches, so the memory use does
+    not grow with the number of rows.
+
+    Args:
+        precision: HyperLogLog precision for distinct counts (default: 14)
+    """
+
+    def __init__(self, precision: int = 14):
+        self.precision = precision
+        self.n_rows = 0
+        self.memory_bytes = 0
+        self.columns: Optional[List[str]] = None
+        self.dtypes: Dict[str, np.dtype] = {}
+        self.null_counts: Optional[pd.Series] = None
+        self.zero_counts: Dict[str, int] = {}
+        self._registers: Dict[str, np.ndarray] = {}
+        self._row_registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Add a chunk of rows to the profile.
+
+        Args:
+            chunk: DataFrame chunk
+        """
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+            self.null_counts = pd.Series(0, index=chunk.columns, dtype=np.int64)
+            self.dtypes = {col: None for col in chunk.columns}
+            self._registers = {
+                col: np.zeros(1 << self.precision, dtype=np.uint8) for col in chunk.columns
+            }
+
+        chunk_nulls = chunk.isnull().sum()
+        for col, dtype in chunk.dtypes.items():
+            # An all-missing chunk says nothing about the column type
+            if chunk_nulls[col] < len(chunk):
+                self.dtypes[col] = _combine_dtypes(self.dtypes[col], dtype)
+
+        self.n_rows += len(chunk)
+        self.memory_bytes += int(chunk.memory_usage(deep=True).sum())
+        self.null_counts += chunk_nulls
+
+        numeric = chunk.select_dtypes(include=[np.number])
+        for col, zeros in (numeric == 0).sum().items():
+            self.zero_counts[col] = self.zero_counts.get(col, 0) + int(zeros)
+
+        hashable = _hashable(chunk)
+        row_hashes = pd.util.hash_pandas_object(hashable, index=False).to_numpy()
+        np.maximum(
+            self._row_registers,
+            hll_registers(row_hashes, self.precision),
+            out=self._row_registers,
+        )
+        for col in chunk.columns:
+            series = hashable[col]
+            hashes = hash_column(series)[series.notna().to_numpy()]
+            np.maximum(
+                self._registers[col],
+                hll_registers(hashes, self.precision),
+                out=self._registers[col],
+            )
+
+    def distinct_counts(self) -> pd.Series:
+        """Estimated number of distinct non-null values per column."""
+        return pd.Series(
+            {col: hll_count(registers) for col, registers in self._registers.items()},
+            dtype=np.float64,
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        """Summary in the format of summarize_dataset."""
+        columns = self.columns or []
+        return {
+            "n_rows": self.n_rows,
+            "n_cols": len(columns),
+            "columns": columns,
+            "dtypes": {col: str(self.dtypes[col] or np.dtype(np.float64)) for col in columns},
+            "memory_usage_mb": self.memory_bytes / 1024**2,
+        }
+
+    def missing_table(self) -> pd.DataFrame:
+        """Missing value table in the format of missing_table."""
+        missing = self.null_counts if self.null_counts is not None else pd.Series(dtype=np.int64)
+        table = pd.DataFrame({
+            "column": missing.index,
+            "missing_count": missing.values,
+            "missing_percent": 100 * missing.values / max(self.n_rows, 1),
+        })
+        return table[table["missing_count"] > 0].sort_values(
+            "missing_percent", ascending=False
+        ).reset_index(drop=True)
+
+    def problematic_columns(self, min_missing_share: float = 0.1) -> List[str]:
+        """Columns with missing share at or above the threshold."""
+        missing_pct = self.null_counts / max(self.n_rows, 1)
+        return list(missing_pct[missing_pct >= min_missing_share].index)
+
+    def quality_flags(
+        self,
+        missing_threshold: float = 0.5,
+        cardinality_threshold: float = 0.5,
+        zero_threshold: float = 0.3,
+        tolerance: float = 0.03
+    ) -> Dict[str, bool]:
+        """Quality flags in the format of compute_quality_flags.
+
+        Args:
+            missing_threshold: Threshold for high missing values (default: 0.5)
+            cardinality_threshold: Threshold for high cardinality categoricals (default: 0.5)
+            zero_threshold: Threshold for many zero values (default: 0.3)
+            tolerance: Relative sketch error tolerated before duplicates are
+                reported (default: 0.03)
+
+        Returns:
+            Dictionary with boolean flags for quality issues
+        """
+        n_rows = max(self.n_rows, 1)
+        distinct = self.distinct_counts()
+        non_null = self.n_rows - self.null_counts
+        missing_pct = self.null_counts / n_rows
+
+        categorical = [
+            col for col, dtype in self.dtypes.items()
+            if dtype is not None and (
+                pd.api.types.is_object_dtype(dtype)
+                or pd.api.types.is_string_dtype(dtype)
+                or isinstance(dtype, pd.CategoricalDtype)
+            )
+        ]
+        id_columns = [
+            col for col in self.columns or []
+            if looks_like_id(col) and self.dtypes[col] is not None
+            and is_key_dtype(self.dtypes[col], True)
+        ]
+
+        flags = {
+            "has_missing_values": (self.null_counts > 0).any(),
+            "has_duplicates": hll_count(self._row_registers) < self.n_rows * (1 - tolerance),
+            "has_high_missing_columns": (missing_pct > missing_threshold).any(),
+            "has_constant_columns": (distinct.round() == 1).any(),
+            "has_high_cardinality_categoricals": (
+                distinct[categorical] / n_rows > cardinality_threshold
+            ).any(),
+            "has_suspicious_id_duplicates": (
+                distinct[id_columns] < non_null[id_columns] * (1 - tolerance)
+            ).any(),
+            "has_many_zero_values": any(
+                zeros / n_rows > zero_threshold for zeros in self.zero_counts.values()
+            ),
+        }
+        return {name: bool(value) for name, value in flags.items()}
+
+
+class RowSampler:
+    """Uniform random sample of rows from chunked input (bottom-k sampling).
+
+    Every row gets a random key; the rows with the n smallest keys seen so
+    far are kept, so the sample is uniform without knowing the row count.
+
+    Args:
+        n: Sample size
+        seed: Random seed for reproducibility
+    """
+
+    def __init__(self, n: int, seed: Optional[int] = None):
+        if n < 0:
+            raise ValueError("Sample size must not be negative")
+        self.n = n
+        self._rng = np.random.default_rng(seed)
+        self._sample: Optional[pd.DataFrame] = None
+        self._keys = np.empty(0)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Offer a chunk of rows to the sample.
+
+        Args:
+            chunk: DataFrame chunk
+        """
+        if self.n == 0:
+            # Keep the columns for an empty sample
+            self._sample = chunk.iloc[:0]
+            return
+        keys = self._rng.random(len(chunk))
+        if len(self._keys) >= self.n:
+            # Only rows that beat the current largest key can enter
+            selected = keys < self._keys.max()
+            chunk, keys = chunk[selected], keys[selected]
+            if len(keys) == 0:
+                return
+        if self._sample is not None:
+            chunk = pd.concat([self._sample, chunk])
+            keys = np.concatenate([self._keys, keys])
+        if len(keys) > self.n:
+            keep = np.argpartition(keys, self.n - 1)[:self.n]
+            chunk, keys = chunk.iloc[keep], keys[keep]
+        self._sample, self._keys = chunk, keys
+
+    def sample(self) -> pd.DataFrame:
+        """Sampled rows in their original order."""
+        if self._sample is None:
+            return pd.DataFrame()
+        return self._sample.sort_index()
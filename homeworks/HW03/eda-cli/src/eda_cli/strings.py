@@ -0,0 +1,159 @@
+"""String column statistics for EDA CLI.
+
+Uses vectorized pyarrow compute kernels when pyarrow is installed and
+falls back to the pandas ``.str`` accessor otherwise.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pc = None
+
+
+# Full-match patterns for value classes (RE2 compatible)
+STRING_PATTERNS = {
+    "numeric": r"^\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*$",
+    "email": r"^[^@\s]+@[^@\s]+\.[^@\s]+$",
+    "uuid": r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$",
+}
+
+
+def _arrow_match(arr, candidates, pattern: str) -> np.ndarray:
+    """Regex-match an Arrow string array, only where candidates is true."""
+    if candidates is None:
+        return pc.match_substring_regex(arr, pattern).to_numpy(zero_copy_only=False)
+    mask = candidates.to_numpy(zero_copy_only=False)
+    result = np.zeros(len(arr), dtype=bool)
+    if mask.any():
+        matched = pc.match_substring_regex(arr.filter(candidates), pattern)
+        result[mask] = matched.to_numpy(zero_copy_only=False)
+    return result
+
+
+def _string_masks(values: pd.Series) -> Dict[str, np.ndarray]:
+    """Compute lengths and class masks for non-null string values."""
+    if pa is not None:
+        arr = pa.array(values.array, from_pandas=True)
+        if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+            arr = arr.cast(pa.string())
+        lengths = pc.utf8_length(arr)
+        masks = {
+            "length": lengths.to_numpy(zero_copy_only=False),
+            "empty": pc.equal(arr, "").to_numpy(zero_copy_only=False),
+            "blank": pc.equal(pc.utf8_trim_whitespace(arr), "").to_numpy(zero_copy_only=False),
+            "numeric": _arrow_match(arr, None, STRING_PATTERNS["numeric"]),
+            # Cheap kernels narrow the values the regex has to scan
+            "email": _arrow_match(arr, pc.match_substring(arr, "@"), STRING_PATTERNS["email"]),
+            "uuid": _arrow_match(arr, pc.equal(lengths, 36), STRING_PATTERNS["uuid"]),
+        }
+        return masks
+
+    text = values.astype(str).str
+    masks = {
+        "length": text.len().to_numpy(),
+        "empty": (values == "").to_numpy(),
+        "blank": (text.strip() == "").to_numpy(),
+    }
+    for name, pattern in STRING_PATTERNS.items():
+        masks[name] = text.match(pattern).to_numpy()
+    return masks
+
+
+def _length_quantiles(
+    lengths: np.ndarray,
+    weights: np.ndarray,
+    quantiles: list
+) -> np.ndarray:
+    """Quantiles of string lengths, each length occurring weights times."""
+    # Lengths are small non-negative integers: a histogram avoids sorting
+    histogram = np.bincount(lengths, weights=weights)
+    cumulative = np.cumsum(histogram)
+    return np.searchsorted(cumulative, np.asarray(quantiles) * cumulative[-1])
+
+
+def string_column_stats(series: pd.Series) -> Optional[Dict[str, Any]]:
+    """Compute length distribution and value classes for a string column.
+
+    Categorical columns are profiled on their categories, weighted by
+    the category counts, so each distinct string is scanned once.
+
+    Args:
+        series: Input column
+
+    Returns:
+        Dictionary with n_values, length statistics, shares of empty,
+        whitespace-only, numeric-looking, email and UUID values,
+        non_string_share and mixed_types, or None if the column has no values
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        values = pd.Series(series.cat.categories)
+        codes = series.cat.codes.to_numpy()
+        weights = np.bincount(codes[codes >= 0], minlength=len(values))
+    else:
+        values = series.dropna()
+        weights = np.ones(len(values), dtype=np.int64)
+
+    n_values = int(weights.sum())
+    if n_values == 0:
+        return None
+
+    # Non-string objects (numbers, dates) mixed into an object column
+    non_string_share = 0.0
+    if pd.api.types.infer_dtype(values, skipna=True) not in ("string", "empty"):
+        is_string = values.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+        non_string_share = float(weights[~is_string].sum() / n_values)
+        values = values.astype(str)
+
+    masks = _string_masks(values)
+    lengths = masks["length"]
+
+    def share(mask):
+        return float(weights[mask.astype(bool)].sum() / n_values)
+
+    p50, p95 = _length_quantiles(lengths, weights, [0.5, 0.95])
+    numeric_share = share(masks["numeric"])
+    return {
+        "n_values": n_values,
+        "min_length": int(lengths[weights > 0].min()),
+        "mean_length": float(np.dot(lengths, weights) / n_values),
+        "median_length": int(p50),
+        "p95_length": int(p95),
+        "max_length": int(lengths[weights > 0].max()),
+        "empty_share": share(masks["empty"]),
+        "whitespace_share": share(masks["blank"] & ~masks["empty"]),
+        "numeric_share": numeric_share,
+        "email_share": share(masks["email"]),
+        "uuid_share": share(masks["uuid"]),
+        "non_string_share": non_string_share,
+        "mixed_types": bool(non_string_share > 0 or 0 < numeric_share < 1),
+    }
+
+
+def string_stats_table(df: pd.DataFrame) -> pd.DataFrame:
+    """Generate table with string statistics for text columns.
+
+    Args:
+        df: Input DataFrame
+
+    Returns:
+        DataFrame with one row per string column: column followed by the
+        fields of string_column_stats
+    """
+    rows = []
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            if pd.api.types.infer_dtype(series.cat.categories) != "string":
+                continue
+        elif not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+            continue
+        stats = string_column_stats(series)
+        if stats is not None:
+            rows.append({"column": col, **stats})
+    return pd.DataFrame(rows)
@@ -0,0 +1,267 @@
+"""Time-bucketed profiling of datetime columns for EDA CLI."""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, Iterable, List, Optional, Union
+
+
+# Bucket sizes tried by automatic selection, from finest to coarsest.
+# Each size is a multiple of the previous one so buckets can be merged.
+BUCKET_SIZES = ["1s", "1min", "5min", "15min", "1h", "6h", "1D", "7D", "28D"]
+
+
+def choose_bucket_size(span: pd.Timedelta, max_buckets: int = 500) -> str:
+    """Pick the finest bucket size that covers a time span in max_buckets.
+
+    Args:
+        span: Time span between the first and last timestamp
+        max_buckets: Maximum number of buckets
+
+    Returns:
+        Bucket size from BUCKET_SIZES
+    """
+    for size in BUCKET_SIZES:
+        if span // pd.Timedelta(size) < max_buckets:
+            return size
+    return BUCKET_SIZES[-1]
+
+
+class TimeSeriesProfiler:
+    """Streaming profiler for row counts, null rates and means over time.
+
+    Chunks are added with update(); each chunk is aggregated in a single
+    grouped pass and merged into the running per-bucket totals. With an
+    automatic bucket size the totals are re-bucketed to a coarser size
+    whenever the observed time span outgrows max_buckets.
+
+    Args:
+        time_column: Name of the datetime column
+        bucket: Bucket size such as "1h" or "1D" (default: automatic)
+        max_buckets: Maximum number of buckets for automatic sizing
+        max_spans: Maximum number of out-of-order spans to keep
+    """
+
+    def __init__(
+        self,
+        time_column: str,
+        bucket: Optional[str] = None,
+        max_buckets: int = 500,
+        max_spans: int = 100
+    ):
+        self.time_column = time_column
+        self.bucket = bucket
+        self.auto_bucket = bucket is None
+        self.max_buckets = max_buckets
+        self.max_spans = max_spans
+
+        self.n_rows = 0
+        self.n_null_timestamps = 0
+        self.n_out_of_order = 0
+        self.n_out_of_order_spans = 0
+        self.out_of_order_spans: List[Dict[str, Any]] = []
+        self.numeric_columns: Optional[List[str]] = None
+        self.other_columns: Optional[List[str]] = None
+
+        self._totals: Optional[pd.DataFrame] = None
+        self._start: Optional[int] = None
+        self._end: Optional[int] = None
+        self._running_max: Optional[int] = None
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Add a chunk of rows to the profile.
+
+        Args:
+            chunk: DataFrame chunk containing the time column
+        """
+        if self.numeric_columns is None:
+            self.other_columns = [c for c in chunk.columns if c != self.time_column]
+            self.numeric_columns = [
+                c for c in chunk.select_dtypes(include=[np.number]).columns
+                if c != self.time_column
+            ]
+
+        times = chunk[self.time_column]
+        if not pd.api.types.is_datetime64_any_dtype(times):
+            times = pd.to_datetime(times, errors="coerce")
+        if getattr(times.dt, "tz", None) is not None:
+            times = times.dt.tz_convert(None)
+        ns = times.dt.as_unit("ns").to_numpy().view(np.int64)
+        valid = ~times.isna().to_numpy()
+
+        offset = self.n_rows
+        self.n_rows += len(chunk)
+        self.n_null_timestamps += int((~valid).sum())
+        if not valid.any():
+            return
+
+        ns = ns[valid]
+        positions = np.flatnonzero(valid) + offset
+        self._track_order(ns, positions)
+
+        chunk_start, chunk_end = int(ns.min()), int(ns.max())
+        self._start = chunk_start if self._start is None else min(self._start, chunk_start)
+        self._end = chunk_end if self._end is None else max(self._end, chunk_end)
+        if self.auto_bucket:
+            span = pd.Timedelta(self._end - self._start)
+            bucket = choose_bucket_size(span, self.max_buckets)
+            if self.bucket is None or pd.Timedelta(bucket) > pd.Timedelta(self.bucket):
+                self.bucket = bucket
+
+        step = pd.Timedelta(self.bucket).value
+        keys = (ns // step) * step
+
+        # One grouped pass over row counts, null indicators, sums and counts
+        rows = chunk.loc[valid]
+        numeric = rows[self.numeric_columns].apply(pd.to_numeric, errors="coerce")
+        parts = pd.concat(
+            [
+                pd.DataFrame({"rows": np.ones(len(rows), dtype=np.int64)}, index=rows.index),
+                rows[self.other_columns].isna().add_prefix("null:"),
+                numeric.fillna(0).add_prefix("sum:"),
+                numeric.notna().add_prefix("count:"),
+            ],
+            axis=1,
+        )
+        totals = parts.groupby(keys).sum()
+        self._merge(totals)
+
+    def _merge(self, totals: pd.DataFrame) -> None:
+        """Merge chunk totals, re-bucketing everything to the current size."""
+        if self._totals is not None:
+            totals = pd.concat([self._totals, totals])
+        step = pd.Timedelta(self.bucket).value
+        keys = (totals.index.to_numpy(dtype=np.int64) // step) * step
+        self._totals = totals.groupby(keys).sum()
+
+    def _track_order(self, ns: np.ndarray, positions: np.ndarray) -> None:
+        """Record rows whose timestamp is earlier than a previous row."""
+        carry = ns[0] if self._running_max is None else self._running_max
+        previous_max = np.maximum.accumulate(np.concatenate([[carry], ns[:-1]]))
+        self._running_max = int(max(previous_max[-1], ns[-1]))
+        late = ns < previous_max
+        if not late.any():
+            return
+
+        late_idx = np.flatnonzero(late)
+        lag = previous_max[late_idx] - ns[late_idx]
+        self.n_out_of_order += len(late_idx)
+
+        # Split late rows into runs of consecutive rows
+        breaks = np.flatnonzero(np.diff(late_idx) > 1) + 1
+        for run, run_lag in zip(np.split(late_idx, breaks), np.split(lag, breaks)):
+            start, end = int(positions[run[0]]), int(positions[run[-1]])
+            spans = self.out_of_order_spans
+            if spans and spans[-1]["end_row"] == start - 1:
+                spans[-1]["end_row"] = end
+                spans[-1]["rows"] += len(run)
+                spans[-1]["max_lag"] = max(spans[-1]["max_lag"], pd.Timedelta(int(run_lag.max())))
+                continue
+            self.n_out_of_order_spans += 1
+            if len(spans) < self.max_spans:
+                spans.append({
+                    "start_row": start,
+                    "end_row": end,
+                    "rows": len(run),
+                    "max_lag": pd.Timedelta(int(run_lag.max())),
+                })
+
+    def buckets(self) -> pd.DataFrame:
+        """Per-bucket row counts, null rates and numeric means.
+
+        Returns:
+            DataFrame indexed by bucket start with columns: rows,
+            null_rate:<column> and mean:<column>
+        """
+        if self._totals is None:
+            return pd.DataFrame()
+        totals = self._totals.sort_index()
+        result = pd.DataFrame(
+            {"rows": totals["rows"].to_numpy()},
+            index=pd.DatetimeIndex(totals.index.to_numpy().astype("datetime64[ns]"), name="bucket"),
+        )
+        rows = totals["rows"].to_numpy()
+        for col in self.other_columns:
+            result[f"null_rate:{col}"] = totals[f"null:{col}"].to_numpy() / rows
+        for col in self.numeric_columns:
+            counts = totals[f"count:{col}"].to_numpy()
+            with np.errstate(invalid="ignore", divide="ignore"):
+                result[f"mean:{col}"] = np.where(
+                    counts > 0, totals[f"sum:{col}"].to_numpy() / counts, np.nan
+                )
+        return result
+
+    def gaps(self) -> pd.DataFrame:
+        """Runs of empty buckets between the first and last timestamp.
+
+        Returns:
+            DataFrame with columns: start, end, missing_buckets
+        """
+        columns = ["start", "end", "missing_buckets"]
+        if self._totals is None or len(self._totals) < 2:
+            return pd.DataFrame(columns=columns)
+        step = pd.Timedelta(self.bucket).value
+        keys = np.sort(self._totals.index.to_numpy(dtype=np.int64))
+        jumps = np.diff(keys)
+        idx = np.flatnonzero(jumps > step)
+        return pd.DataFrame({
+            "start": (keys[idx] + step).astype("datetime64[ns]"),
+            "end": keys[idx + 1].astype("datetime64[ns]"),
+            "missing_buckets": jumps[idx] // step - 1,
+        })
+
+    def result(self) -> Dict[str, Any]:
+        """Collect the time-series profile.
+
+        Returns:
+            Dictionary with time_column, bucket, start, end, n_rows,
+            n_null_timestamps, n_out_of_order, n_out_of_order_spans,
+            buckets, gaps and out_of_order (DataFrames)
+        """
+        return {
+            "time_column": self.time_column,
+            "bucket": self.bucket,
+            "start": None if self._start is None else pd.Timestamp(self._start),
+            "end": None if self._end is None else pd.Timestamp(self._end),
+            "n_rows": self.n_rows,
+            "n_null_timestamps": self.n_null_timestamps,
+            "n_out_of_order": self.n_out_of_order,
+            "n_out_of_order_spans": self.n_out_of_order_spans,
+            "buckets": self.buckets(),
+            "gaps": self.gaps(),
+            "out_of_order": pd.DataFrame(
+                self.out_of_order_spans,
+                columns=["start_row", "end_row", "rows", "max_lag"],
+            ),
+        }
+
+
+def profile_time_series(
+    data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    time_column: Optional[str] = None,
+    bucket: Optional[str] = None,
+    max_buckets: int = 500
+) -> Optional[Dict[str, Any]]:
+    """Profile a dataset over time, one chunk at a time.
+
+    Args:
+        data: DataFrame or iterable of DataFrame chunks
+        time_column: Datetime column to bucket by (default: first datetime column)
+        bucket: Bucket size such as "1h" or "1D" (default: automatic)
+        max_buckets: Maximum number of buckets for automatic sizing
+
+    Returns:
+        Profile dictionary from TimeSeriesProfiler.result(), or None if
+        there is no datetime column
+    """
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    profiler = None
+    for chunk in chunks:
+        if profiler is None:
+            if time_column is None:
+                datetime_cols = chunk.select_dtypes(include=["datetime", "datetimetz"]).columns
+                if len(datetime_cols) == 0:
+                    return None
+                time_column = datetime_cols[0]
+            profiler = TimeSeriesProfiler(time_column, bucket, max_buckets)
+        profiler.update(chunk)
+    return None if profiler is None else profiler.result()
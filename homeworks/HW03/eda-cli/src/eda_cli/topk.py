@@ -0,0 +1,277 @@
+"""Batched top-k category counts for many columns."""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple
+
+from .sketches import CountMinSketch, hash_column
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+
+def _is_arrow_dictionary(dtype: Any) -> bool:
+    """Check whether a dtype is an Arrow dictionary (pandas ArrowDtype)."""
+    return (
+        pa is not None
+        and isinstance(dtype, pd.ArrowDtype)
+        and pa.types.is_dictionary(dtype.pyarrow_dtype)
+    )
+
+
+def _codes(series: pd.Series) -> Optional[Tuple[np.ndarray, pd.Index]]:
+    """Integer codes (-1 for missing) and categories of a dictionary-encoded column.
+
+    Returns:
+        Tuple of (codes, categories) for category and Arrow dictionary
+        columns, None for other columns
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    if _is_arrow_dictionary(series.dtype):
+        arr = pa.array(series.array)
+        if isinstance(arr, pa.ChunkedArray):
+            # Chunks may carry their own dictionaries
+            arr = arr.unify_dictionaries().combine_chunks()
+        codes = arr.indices.fill_null(-1).to_numpy(zero_copy_only=False)
+        return codes.astype(np.intp), pd.Index(arr.dictionary.to_pandas())
+    return None
+
+
+def categorical_columns(df: pd.DataFrame) -> List[str]:
+    """List object, string, category and Arrow dictionary columns.
+
+    Args:
+        df: Input DataFrame
+
+    Returns:
+        List of column names
+    """
+    return [
+        col for col, dtype in df.dtypes.items()
+        if pd.api.types.is_object_dtype(dtype)
+        or pd.api.types.is_string_dtype(dtype)
+        or isinstance(dtype, pd.CategoricalDtype)
+        or _is_arrow_dictionary(dtype)
+    ]
+
+
+def _top_indices(counts: np.ndarray, top_k: int) -> np.ndarray:
+    """Indices of the top_k largest counts, ties in index order."""
+    if len(counts) > top_k:
+        kth = np.partition(counts, len(counts) - top_k)[len(counts) - top_k]
+        above = np.flatnonzero(counts > kth)
+        ties = np.flatnonzero(counts == kth)[:top_k - len(above)]
+        candidates = np.sort(np.concatenate([above, ties]))
+    else:
+        candidates = np.arange(len(counts))
+    return candidates[np.argsort(-counts[candidates], kind="stable")]
+
+
+class _ExactCounts:
+    """Counts per distinct value, in order of first appearance."""
+
+    def __init__(self):
+        self.values = pd.Index([])
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def add(self, values: pd.Index, counts: np.ndarray) -> None:
+        if len(self.values) == 0:
+            self.values, self.counts = values, counts.astype(np.int64)
+            return
+        positions = self.values.get_indexer(values)
+        new = positions < 0
+        np.add.at(self.counts, positions[~new], counts[~new])
+        if new.any():
+            self.values = self.values.append(values[new])
+            self.counts = np.concatenate([self.counts, counts[new]])
+
+
+class _HeavyHitters:
+    """Count-Min sketch plus a bounded set of candidate heavy values."""
+
+    def __init__(self, capacity: int, width_bits: int):
+        self.capacity = capacity
+        self.sketch = CountMinSketch(width_bits=width_bits)
+        self.hashes = np.zeros(0, dtype=np.uint64)
+        self.values: List[Any] = []
+
+    def add(self, hashes: np.ndarray, values: pd.Series, counts: Optional[np.ndarray] = None) -> None:
+        self.sketch.add(hashes, counts)
+
+        # Rows estimated at least as frequent as the weakest candidate
+        estimates = self.sketch.estimate(hashes)
+        positions = np.arange(len(hashes))
+        if len(self.hashes) >= self.capacity:
+            floor = self.sketch.estimate(self.hashes).min()
+            positions = positions[estimates >= floor]
+        first = ~pd.Series(hashes[positions]).duplicated().to_numpy()
+        positions = positions[first]
+        positions = positions[_top_indices(estimates[positions], self.capacity)]
+        positions = positions[~np.isin(hashes[positions], self.hashes)]
+
+        # Only the new candidates' values are materialized
+        self.hashes = np.concatenate([self.hashes, hashes[positions]])
+        self.values.extend(values.iloc[positions].tolist())
+
+        # Drop the weakest candidates beyond capacity
+        if len(self.hashes) > self.capacity:
+            keep = np.sort(_top_indices(self.sketch.estimate(self.hashes), self.capacity))
+            self.hashes = self.hashes[keep]
+            self.values = [self.values[i] for i in keep]
+
+    def top(self, top_k: int) -> List[tuple]:
+        # Estimates within the error bound cannot be told apart from noise
+        estimates = self.sketch.estimate(self.hashes)
+        return [
+            (self.values[i], int(estimates[i]))
+            for i in _top_indices(estimates, top_k)
+            if estimates[i] > self.sketch.error_bound
+        ]
+
+
+class TopKCounter:
+    """Top-k most frequent values of many categorical columns in one pass.
+
+    Category and Arrow dictionary columns are counted from their codes
+    with np.bincount, without hashing any value. Other columns are
+    counted with one unsorted value_counts per column and chunk, so in
+    memory this costs about as much as per-column value_counts; the gain
+    is that every column is covered in the same pass over the input and
+    that memory stays bounded while streaming. Counts are merged across
+    chunks and the top values are picked with a partial sort at the end.
+    A column whose number of distinct values outgrows exact_limit
+    switches to a Count-Min sketch with a bounded candidate set; its
+    counts are then upper bounds and only values counted above the
+    sketch error bound are reported. Chunks can be
+    added one at a time with update().
+
+    Args:
+        columns: Columns to count (default: categorical columns of the first chunk)
+        top_k: Number of top values per column
+        max_columns: Maximum number of columns to count (default: all)
+        exact_limit: Maximum distinct values per column counted exactly
+            (None: always exact, for data already in memory)
+        width_bits: log2 of the Count-Min sketch width for sketched columns
+    """
+
+    def __init__(
+        self,
+        columns: Optional[List[str]] = None,
+        top_k: int = 10,
+        max_columns: Optional[int] = None,
+        exact_limit: Optional[int] = 100_000,
+        width_bits: int = 14
+    ):
+        self.columns = columns
+        self.top_k = top_k
+        self.max_columns = max_columns
+        self.exact_limit = exact_limit
+        self.width_bits = width_bits
+        self.n_rows = 0
+        self.non_null: Dict[str, int] = {}
+        self._exact: Dict[str, _ExactCounts] = {}
+        self._sketched: Dict[str, _HeavyHitters] = {}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Count the values of a chunk.
+
+        Args:
+            chunk: DataFrame chunk
+        """
+        if self.columns is None:
+            self.columns = categorical_columns(chunk)
+        if self.max_columns is not None:
+            self.columns = self.columns[:self.max_columns]
+
+        self.n_rows += len(chunk)
+        for col in self.columns:
+            series = chunk[col]
+            if col in self._sketched:
+                self._add_sketched(col, series)
+                continue
+
+            counts = self._exact.setdefault(col, _ExactCounts())
+            coded = _codes(series)
+            if coded is not None:
+                # Dictionary-encoded: count the codes, no hashing
+                codes, categories = coded
+                codes = codes[codes >= 0]
+                self.non_null[col] = self.non_null.get(col, 0) + len(codes)
+                counts.add(categories, np.bincount(codes, minlength=len(categories)))
+            else:
+                values = series.value_counts(sort=False)
+                self.non_null[col] = self.non_null.get(col, 0) + int(values.sum())
+                counts.add(values.index, values.to_numpy())
+            if self.exact_limit is not None and len(counts.values) > self.exact_limit:
+                self._to_sketch(col)
+
+    def _to_sketch(self, col: str) -> None:
+        """Move a column from exact counts to the heavy-hitter sketch."""
+        counts = self._exact.pop(col)
+        sketched = _HeavyHitters(capacity=4 * self.top_k, width_bits=self.width_bits)
+        if len(counts.values):
+            values = pd.Series(counts.values)
+            sketched.add(hash_column(values), values, counts.counts)
+        self._sketched[col] = sketched
+
+    def _add_sketched(self, col: str, series: pd.Series) -> None:
+        values = series.dropna()
+        self.non_null[col] = self.non_null.get(col, 0) + len(values)
+        self._sketched[col].add(hash_column(values), values)
+
+    def result(self) -> Dict[str, Dict[str, Any]]:
+        """Top values per column.
+
+        Returns:
+            Dictionary mapping column name to a dictionary with values
+            (list of (value, count) tuples), non_null, exact and
+            error_bound (maximum overcount of sketched columns, else 0)
+        """
+        result = {}
+        for col in self.columns or []:
+            error_bound = 0
+            if col in self._sketched:
+                values, exact = self._sketched[col].top(self.top_k), False
+                error_bound = self._sketched[col].sketch.error_bound
+            elif col in self._exact:
+                counts = self._exact[col]
+                values = [
+                    (counts.values[i], int(counts.counts[i]))
+                    for i in _top_indices(counts.counts, self.top_k)
+                    if counts.counts[i] > 0
+                ]
+                exact = True
+            else:
+                continue
+            result[col] = {
+                "values": values,
+                "non_null": self.non_null.get(col, 0),
+                "exact": exact,
+                "error_bound": error_bound,
+            }
+        return result
+
+
+def top_categories(
+    df: pd.DataFrame,
+    columns: Optional[List[str]] = None,
+    top_k: int = 10,
+    max_columns: Optional[int] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Get exact top K most frequent values for many categorical columns.
+
+    Args:
+        df: Input DataFrame
+        columns: Columns to count (default: all categorical columns)
+        top_k: Number of top values per column
+        max_columns: Maximum number of columns (default: all)
+
+    Returns:
+        Dictionary from TopKCounter.result()
+    """
+    counter = TopKCounter(columns, top_k=top_k, max_columns=max_columns, exact_limit=None)
+    counter.update(df)
+    return counter.result()
@@ -158,3 +158,61 @@ def plot_missing_matrix(
     plt.tight_layout()
     plt.savefig(output_file, dpi=100, bbox_inches='tight')
     plt.close()
+
+
+def plot_time_buckets(
+    buckets: pd.DataFrame,
+    output_file: str,
+    gaps: Optional[pd.DataFrame] = None,
+    max_columns: int = 4,
+    figsize_per_plot: tuple = (12, 2.5)
+):
+    """Plot per-bucket row counts, null rate and numeric means over time.
+    
+    Args:
+        buckets: Bucket table from the time-series profile
+        output_file: Path to save the plot
+        gaps: Gap table from the time-series profile, shaded on every panel
+        max_columns: Maximum number of numeric means to plot
+        figsize_per_plot: Size of each subplot
+    """
+    if buckets.empty:
+        fig, ax = plt.subplots(figsize=(8, 4))
+        ax.text(0.5, 0.5, 'No time buckets to plot',
+                ha='center', va='center', fontsize=14)
+        ax.axis('off')
+        plt.tight_layout()
+        plt.savefig(output_file, dpi=100, bbox_inches='tight')
+        plt.close()
+        return
+    
+    null_cols = [c for c in buckets.columns if c.startswith('null_rate:')]
+    mean_cols = [c for c in buckets.columns if c.startswith('mean:')][:max_columns]
+    n_plots = 1 + bool(null_cols) + len(mean_cols)
+    
+    fig, axes = plt.subplots(
+        n_plots, 1,
+        figsize=(figsize_per_plot[0], figsize_per_plot[1] * n_plots),
+        sharex=True
+    )
+    axes = np.atleast_1d(axes)
+    
+    panels = [('Rows', buckets['rows'])]
+    if null_cols:
+        panels.append(('Mean null rate', buckets[null_cols].mean(axis=1)))
+    panels += [(col.split(':', 1)[1], buckets[col]) for col in mean_cols]
+    
+    for ax, (label, values) in zip(axes, panels):
+        ax.plot(buckets.index, values, marker='.', linewidth=1)
+        ax.set_ylabel(label, fontsize=8)
+        ax.tick_params(labelsize=7)
+        ax.grid(alpha=0.3)
+        if gaps is not None:
+            for _, gap in gaps.iterrows():
+                ax.axvspan(gap['start'], gap['end'], color='red', alpha=0.15)
+    
+    axes[0].set_title('Time Series Profile', fontsize=14)
+    axes[-1].set_xlabel('Time bucket', fontsize=10)
+    plt.tight_layout()
+    plt.savefig(output_file, dpi=100, bbox_inches='tight')
+    plt.close()
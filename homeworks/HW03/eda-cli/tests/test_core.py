@@ -8,8 +8,12 @@ from eda_cli.core import (
     missing_table,
     correlation_matrix,
     compute_quality_flags,
+    detect_key_candidates,
     get_top_categories,
     get_problematic_columns,
+    detect_datetime_columns,
+    load_csv,
+    read_csv_chunks,
 )
 
 
@@ -153,6 +157,11 @@ def test_get_top_categories():
     assert top[0][1] == 3    # Count
     assert top[1][0] == "b"  # Second most frequent
     assert top[1][1] == 2    # Count
+    
+    # Counts stay exact for columns with many distinct values
+    df_many = pd.DataFrame({"hi": [str(i % 150_000) for i in range(200_000)]})
+    top = get_top_categories(df_many, "hi", top_k=3)
+    assert [count for _, count in top] == [2, 2, 2]
 
 
 def test_get_problematic_columns():
@@ -172,3 +181,134 @@ def test_get_problematic_columns():
     assert "a" in problematic_low
     assert "b" in problematic_low
     assert "c" not in problematic_low
+
+
+def test_quality_flag_id_name_substrings_ignored():
+    """Test that columns merely containing 'id' are not treated as IDs."""
+    df = pd.DataFrame({
+        "paid_amount": [10, 10, 20, 20],
+        "width": [1, 1, 2, 2],
+    })
+    flags = compute_quality_flags(df)
+    assert flags["has_suspicious_id_duplicates"] is False
+    
+    df_camel = pd.DataFrame({"orderId": [1, 1, 2, 3]})
+    flags = compute_quality_flags(df_camel)
+    assert flags["has_suspicious_id_duplicates"] is True
+    
+    for name in ("userid", "customerid", "orderid", "apikey"):
+        df_lower = pd.DataFrame({name: [1, 1, 2, 3]})
+        flags = compute_quality_flags(df_lower)
+        assert flags["has_suspicious_id_duplicates"] is True, name
+    
+    for name in ("valid", "invalid", "fluid", "hybrid", "android", "kid"):
+        df_word = pd.DataFrame({name: [1, 1, 2, 3]})
+        flags = compute_quality_flags(df_word)
+        assert flags["has_suspicious_id_duplicates"] is False, name
+
+
+def test_detect_key_candidates():
+    """Test single-column and composite key detection."""
+    df = pd.DataFrame({
+        "row": np.arange(8),
+        "order_id": [1, 1, 2, 2, 3, 3, 4, 4],
+        "line_no": [1, 2, 1, 2, 1, 2, 1, 2],
+        "token": ["a", "b", "c", "d", "e", "f", "g", "h"],
+        "amount": [5, 5, 5, 5, 7, 7, 7, 7],
+    })
+    keys = detect_key_candidates(df)
+    by_columns = {row["columns"]: row for _, row in keys.iterrows()}
+    
+    assert by_columns[("row",)]["is_unique"]
+    assert by_columns[("row",)]["monotonic"]
+    assert by_columns[("token",)]["is_unique"]
+    assert not by_columns[("order_id",)]["is_unique"]
+    assert by_columns[("order_id",)]["uniqueness_ratio"] == pytest.approx(0.5, rel=0.05)
+    assert ("order_id", "line_no") in by_columns
+    assert ("amount",) not in by_columns
+    
+    # Cheap checks skip non-ID columns unless a pair needs them
+    no_ids = df.drop(columns="order_id")
+    assert list(detect_key_candidates(no_ids)["columns"]) == [("row",), ("token",)]
+    
+    id_only = detect_key_candidates(df, id_columns_only=True)
+    assert list(id_only["columns"]) == [("order_id",)]
+
+
+def test_key_candidates_ignore_missing_values():
+    """Test that uniqueness is measured over non-null values."""
+    rng = np.random.default_rng(0)
+    for null_share in (0.05, 0.5):
+        ids = rng.permutation(10_000).astype(float)
+        ids[rng.random(len(ids)) < null_share] = np.nan
+        df = pd.DataFrame({"user_id": ids})
+        keys = detect_key_candidates(df)
+        
+        assert keys.loc[0, "is_unique"]
+        assert keys.loc[0, "uniqueness_ratio"] == 1.0
+        assert compute_quality_flags(df)["has_suspicious_id_duplicates"] is False
+
+
+def test_detect_datetime_columns():
+    """Test detection of timestamp strings."""
+    df = pd.DataFrame({
+        "event_time": ["2024-01-01 10:00:00", "2024-01-02 11:30:00", None],
+        "day": ["01/02/2024", "03/04/2024", "05/06/2024"],
+        "name": ["Alice", "Bob", "Charlie"],
+        "code": ["A-1", "B-2", "C-3"],
+    })
+    formats = detect_datetime_columns(df)
+    
+    assert formats == {"event_time": "%Y-%m-%d %H:%M:%S", "day": "%m/%d/%Y"}
+
+
+def test_detect_datetime_columns_needs_full_date():
+    """Test that fractions and times of day are not taken for dates."""
+    df = pd.DataFrame({
+        "ratio": ["1/2", "3/4", "5/6"],
+        "time": ["10:30", "11:45", "12:00"],
+        "month": ["2024-01", "2024-02", "2024-03"],
+        "iso": ["2024-01-01T10:00:00", "2024-01-02T11:30:00.5", "2024-01-03"],
+        "day_first": ["01/02/2024", "13/04/2024", "05/06/2024"],
+    })
+    formats = detect_datetime_columns(df)
+    
+    assert formats == {"iso": "ISO8601", "day_first": "%d/%m/%Y"}
+
+
+def test_load_csv_parses_dates(tmp_path):
+    """Test that loading converts timestamp columns in full and chunked reads."""
+    path = tmp_path / "events.csv"
+    pd.DataFrame({
+        "ts": pd.date_range("2024-01-01", periods=10, freq="h").astype(str),
+        "value": range(10),
+    }).to_csv(path, index=False)
+    
+    df = load_csv(str(path))
+    assert pd.api.types.is_datetime64_any_dtype(df["ts"])
+    
+    chunks = list(read_csv_chunks(str(path), chunksize=4))
+    assert len(chunks) == 3
+    assert all(pd.api.types.is_datetime64_any_dtype(c["ts"]) for c in chunks)
+
+
+def test_load_csv_keeps_non_dates(tmp_path):
+    """Test that fractions and times of day stay strings on load."""
+    path = tmp_path / "mixed.csv"
+    path.write_text("ratio,time\n1/2,10:30\n3/4,11:45\n")
+    
+    df = load_csv(str(path))
+    assert df["ratio"].tolist() == ["1/2", "3/4"]
+    assert df["time"].tolist() == ["10:30", "11:45"]
+
+
+def test_read_csv_chunks_uses_one_format(tmp_path):
+    """Test that every chunk is parsed with the format of the first chunk."""
+    path = tmp_path / "days.csv"
+    days = ["01/05/2024", "02/05/2024", "03/05/2024", "04/05/2024", "13/05/2024", "03/04/2024"]
+    pd.DataFrame({"day": days}).to_csv(path, index=False)
+    
+    parsed = pd.concat(read_csv_chunks(str(path), chunksize=4))["day"]
+    assert parsed.iloc[0] == pd.Timestamp("2024-01-05")
+    assert pd.isna(parsed.iloc[4])
+    assert parsed.iloc[5] == pd.Timestamp("2024-03-04")
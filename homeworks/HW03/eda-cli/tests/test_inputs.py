@@ -0,0 +1,114 @@
+"""Unit tests for input streams."""
+
+import bz2
+import gzip
+import io
+import lzma
+import sys
+import zipfile
+
+import pytest
+from click.testing import CliRunner
+from eda_cli.cli import cli
+from eda_cli.core import load_csv, read_csv_chunks
+from eda_cli.inputs import detect_compression, open_input
+
+
+CSV = b"a,b\n1,x\n2,y\n3,z\n"
+
+
+@pytest.mark.parametrize("name, compress", [
+    ("gzip", gzip.compress),
+    ("bz2", bz2.compress),
+    ("xz", lzma.compress),
+])
+def test_open_input_compressed(tmp_path, name, compress):
+    """Test that compressed files are detected and decompressed."""
+    path = tmp_path / "data.bin"
+    path.write_bytes(compress(CSV))
+    
+    assert detect_compression(path.read_bytes()[:6]) == name
+    with open_input(str(path)) as stream:
+        assert stream.read() == CSV
+    
+    df = load_csv(str(path))
+    assert list(df["a"]) == [1, 2, 3]
+
+
+def test_open_input_zstd(tmp_path):
+    """Test zstd input when a zstd library is installed."""
+    zstandard = pytest.importorskip("zstandard")
+    path = tmp_path / "data.csv.zst"
+    path.write_bytes(zstandard.ZstdCompressor().compress(CSV))
+    
+    assert detect_compression(path.read_bytes()[:6]) == "zstd"
+    chunks = list(read_csv_chunks(str(path), chunksize=2))
+    assert [len(c) for c in chunks] == [2, 1]
+
+
+def test_open_input_zip(tmp_path):
+    """Test zip archives with a single CSV file."""
+    path = tmp_path / "data.csv.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("data.csv", CSV)
+    
+    assert detect_compression(path.read_bytes()[:6]) == "zip"
+    df = load_csv(str(path))
+    assert list(df["b"]) == ["x", "y", "z"]
+    
+    with zipfile.ZipFile(path, "a") as archive:
+        archive.writestr("other.csv", CSV)
+    with pytest.raises(ValueError, match="exactly one file"):
+        load_csv(str(path))
+
+
+def test_open_input_plain_and_no_read_ahead(tmp_path):
+    """Test plain files and decompression without the reader thread."""
+    plain = tmp_path / "data.csv"
+    plain.write_bytes(CSV)
+    assert detect_compression(CSV) is None
+    with open_input(str(plain)) as stream:
+        assert stream.read() == CSV
+    
+    packed = tmp_path / "data.csv.gz"
+    packed.write_bytes(gzip.compress(CSV * 1000))
+    with open_input(str(packed), read_ahead=False) as stream:
+        assert stream.read() == CSV * 1000
+
+
+class OneByteReader(io.RawIOBase):
+    """Non-seekable stream that returns one byte per read, like a slow pipe."""
+    
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, buffer):
+        chunk = self._data.read(1)
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+def test_open_input_stdin_short_reads(monkeypatch):
+    """Test that the xz magic is found when a pipe delivers few bytes at a time."""
+    stdin = io.TextIOWrapper(io.BufferedReader(OneByteReader(lzma.compress(CSV)), buffer_size=1))
+    monkeypatch.setattr(sys, "stdin", stdin)
+    
+    with open_input("-") as stream:
+        assert stream.read() == CSV
+
+
+def test_cli_reads_stdin():
+    """Test CLI commands on compressed data piped to standard input."""
+    runner = CliRunner()
+    data = CSV + CSV.split(b"\n", 1)[1]
+    result = runner.invoke(cli, ["overview", "-"], input=gzip.compress(data))
+    assert result.exit_code == 0, result.output
+    assert "Rows: 6" in result.output
+    assert "✓ has_duplicates" in result.output
+    
+    result = runner.invoke(cli, ["head", "-", "--n", "2"], input=CSV)
+    assert result.exit_code == 0, result.output
+    assert "x" in result.output and "z" not in result.output
@@ -0,0 +1,109 @@
+"""Unit tests for single-pass streaming profiling."""
+
+import pytest
+import pandas as pd
+import numpy as np
+from eda_cli.core import (
+    summarize_dataset,
+    missing_table,
+    compute_quality_flags,
+    get_problematic_columns,
+)
+from eda_cli.streaming import RowSampler, StreamingProfiler
+
+
+def make_frame():
+    """Frame that trips several quality flags."""
+    return pd.DataFrame({
+        "user_id": [1, 2, 2, 3, 4, 5, 6, 7, 8, 9],
+        "constant": [1] * 10,
+        "zeros": [0, 0, 0, 0, 1, 2, 3, 4, 5, 6],
+        "name": ["a", "b", "c", "d", "e", "f", "g", None, None, None],
+    })
+
+
+def profile_in_chunks(df, chunksize):
+    """Feed a frame to a StreamingProfiler in chunks."""
+    profiler = StreamingProfiler()
+    for start in range(0, len(df), chunksize):
+        profiler.update(df.iloc[start:start + chunksize])
+    return profiler
+
+
+def test_streaming_profiler_matches_in_memory():
+    """Test that chunked profiling matches the in-memory functions."""
+    df = make_frame()
+    profiler = profile_in_chunks(df, chunksize=3)
+    
+    assert profiler.quality_flags() == compute_quality_flags(df)
+    pd.testing.assert_frame_equal(profiler.missing_table(), missing_table(df))
+    assert profiler.problematic_columns(0.2) == get_problematic_columns(df, 0.2)
+    
+    summary = profiler.summary()
+    expected = summarize_dataset(df)
+    assert summary["n_rows"] == expected["n_rows"]
+    assert summary["dtypes"] == expected["dtypes"]
+
+
+def test_streaming_profiler_read_csv_chunks(tmp_path):
+    """Test flags on read_csv chunks whose dtypes change with missing values."""
+    n = 3000
+    df = pd.DataFrame({
+        "user_id": np.arange(n) % 500,
+        "flag": [1] * n,
+        "value": np.arange(n),
+    }).astype({"user_id": "Int64", "flag": "Int64"})
+    df.loc[2500:2510, ["user_id", "flag"]] = pd.NA
+    path = tmp_path / "users.csv"
+    df.to_csv(path, index=False)
+    
+    profiler = StreamingProfiler()
+    dtypes = set()
+    for chunk in pd.read_csv(path, chunksize=1000):
+        dtypes.add(str(chunk["flag"].dtype))
+        profiler.update(chunk)
+    assert dtypes == {"int64", "float64"}
+    
+    flags = profiler.quality_flags()
+    assert flags == compute_quality_flags(pd.read_csv(path))
+    assert flags["has_constant_columns"] is True
+    assert flags["has_suspicious_id_duplicates"] is True
+    assert profiler.distinct_counts()["flag"] == pytest.approx(1, abs=0.5)
+
+
+def test_streaming_profiler_dtype_across_chunks():
+    """Test that all-missing chunks do not change the column dtype."""
+    df = pd.DataFrame({"x": [np.nan, np.nan, "a", "b"]}, dtype=object)
+    profiler = StreamingProfiler()
+    profiler.update(df.iloc[:2].astype(float))
+    profiler.update(df.iloc[2:].astype(str))
+    assert profiler.summary()["dtypes"]["x"] == str(df.iloc[2:].astype(str)["x"].dtype)
+
+
+def test_row_sampler():
+    """Test sample size, row order and reproducibility."""
+    df = pd.DataFrame({"a": np.arange(1000)})
+    
+    def run(seed):
+        sampler = RowSampler(50, seed=seed)
+        for start in range(0, len(df), 128):
+            sampler.update(df.iloc[start:start + 128])
+        return sampler.sample()
+    
+    sample = run(seed=1)
+    assert len(sample) == 50
+    assert sample.index.is_monotonic_increasing
+    assert sample["a"].nunique() == 50
+    pd.testing.assert_frame_equal(sample, run(seed=1))
+    
+    sampler = RowSampler(50)
+    sampler.update(df.iloc[:10])
+    assert len(sampler.sample()) == 10
+    
+    sampler = RowSampler(0)
+    sampler.update(df)
+    assert sampler.sample().empty
+    assert list(sampler.sample().columns) == ["a"]
+    
+    with pytest.raises(ValueError):
+        RowSampler(-1)
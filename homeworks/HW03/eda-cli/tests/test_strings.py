@@ -0,0 +1,66 @@
+"""Unit tests for string column statistics."""
+
+import pytest
+import pandas as pd
+from eda_cli import strings
+from eda_cli.strings import (
+    string_column_stats,
+    string_stats_table,
+)
+
+
+def make_strings():
+    """Column with one value of each string class."""
+    return pd.Series([
+        "abc", "", "   ", "42", "-1.5e3", "user@example.com",
+        "123e4567-e89b-12d3-a456-426614174000", None,
+    ])
+
+
+def test_string_column_stats():
+    """Test length distribution and value classes."""
+    stats = string_column_stats(make_strings())
+    
+    assert stats["n_values"] == 7
+    assert stats["min_length"] == 0
+    assert stats["max_length"] == 36
+    assert stats["empty_share"] == pytest.approx(1 / 7)
+    assert stats["whitespace_share"] == pytest.approx(1 / 7)
+    assert stats["numeric_share"] == pytest.approx(2 / 7)
+    assert stats["email_share"] == pytest.approx(1 / 7)
+    assert stats["uuid_share"] == pytest.approx(1 / 7)
+    assert stats["mixed_types"] is True
+
+
+def test_string_column_stats_without_pyarrow(monkeypatch):
+    """Test that the pandas fallback gives the same statistics."""
+    expected = string_column_stats(make_strings())
+    monkeypatch.setattr(strings, "pa", None)
+    assert string_column_stats(make_strings()) == expected
+
+
+def test_string_column_stats_categorical_and_mixed():
+    """Test categorical weighting and non-string objects."""
+    series = pd.Series(["aa", "bbbb", "aa", "aa"], dtype="category")
+    stats = string_column_stats(series)
+    assert stats["n_values"] == 4
+    assert stats["median_length"] == 2
+    assert stats["mean_length"] == pytest.approx(2.5)
+    
+    mixed = pd.Series(["a", 1, 2.5, "b"], dtype=object)
+    stats = string_column_stats(mixed)
+    assert stats["non_string_share"] == pytest.approx(0.5)
+    assert stats["mixed_types"] is True
+
+
+def test_string_stats_table():
+    """Test that only text columns are profiled."""
+    df = pd.DataFrame({
+        "name": ["Alice", "Bob", "Charlie"],
+        "age": [25, 30, 35],
+        "empty": [None, None, None],
+    })
+    table = string_stats_table(df)
+    
+    assert list(table["column"]) == ["name"]
+    assert table["max_length"].iloc[0] == 7
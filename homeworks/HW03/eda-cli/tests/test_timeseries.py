@@ -0,0 +1,67 @@
+"""Unit tests for time-series profiling."""
+
+import pytest
+import pandas as pd
+import numpy as np
+from eda_cli.timeseries import (
+    choose_bucket_size,
+    profile_time_series,
+)
+
+
+def make_events():
+    """Hourly events over 10 days with one missing day and late rows."""
+    times = pd.date_range("2024-01-01", periods=240, freq="h")
+    times = times[(times < "2024-01-05") | (times >= "2024-01-06")]
+    df = pd.DataFrame({
+        "ts": times,
+        "value": np.arange(len(times), dtype=float),
+        "label": ["a", None] * (len(times) // 2),
+    })
+    df.loc[50:52, "ts"] = pd.Timestamp("2024-01-01")
+    return df
+
+
+def test_choose_bucket_size():
+    """Test automatic bucket size selection."""
+    assert choose_bucket_size(pd.Timedelta("10min"), max_buckets=1000) == "1s"
+    assert choose_bucket_size(pd.Timedelta("10D"), max_buckets=500) == "1h"
+    assert choose_bucket_size(pd.Timedelta("3650D"), max_buckets=500) == "28D"
+
+
+def test_profile_time_series():
+    """Test per-bucket aggregates, gaps and out-of-order spans."""
+    profile = profile_time_series(make_events(), bucket="1D")
+    buckets = profile["buckets"]
+    
+    assert profile["time_column"] == "ts"
+    assert buckets["rows"].sum() == 216
+    assert buckets["null_rate:label"].iloc[1] == pytest.approx(0.5)
+    assert buckets["mean:value"].iloc[1] == pytest.approx(np.mean(np.arange(24, 48)))
+    
+    gaps = profile["gaps"]
+    assert len(gaps) == 1
+    assert gaps["start"].iloc[0] == pd.Timestamp("2024-01-05")
+    assert gaps["missing_buckets"].iloc[0] == 1
+    
+    assert profile["n_out_of_order"] == 3
+    assert profile["n_out_of_order_spans"] == 1
+    assert profile["out_of_order"]["start_row"].iloc[0] == 50
+
+
+def test_profile_time_series_streaming_matches_full():
+    """Test that chunked profiling gives the same result as one frame."""
+    df = make_events()
+    full = profile_time_series(df)
+    chunks = (df.iloc[i:i + 25] for i in range(0, len(df), 25))
+    streamed = profile_time_series(chunks)
+    
+    assert streamed["bucket"] == full["bucket"]
+    pd.testing.assert_frame_equal(streamed["buckets"], full["buckets"])
+    assert streamed["n_out_of_order"] == full["n_out_of_order"]
+
+
+def test_profile_time_series_without_datetime():
+    """Test that frames without datetime columns are skipped."""
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    assert profile_time_series(df) is None
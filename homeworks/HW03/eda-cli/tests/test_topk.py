@@ -0,0 +1,118 @@
+"""Unit tests for batched top-k category counts."""
+
+import pytest
+import pandas as pd
+import numpy as np
+from eda_cli.sketches import CountMinSketch, hash_column
+from eda_cli.topk import TopKCounter, categorical_columns, top_categories
+
+
+def test_categorical_columns():
+    """Test selection of object, string and category columns."""
+    df = pd.DataFrame({
+        "name": ["a", "b"],
+        "obj": pd.Series(["x", 1], dtype=object),
+        "cat": pd.Categorical(["u", "v"]),
+        "num": [1, 2],
+    })
+    assert categorical_columns(df) == ["name", "obj", "cat"]
+
+
+def test_top_categories_matches_value_counts():
+    """Test exact counts for string and category columns in one call."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "city": rng.choice(["Oslo", "Rome", "Lima", None], 500),
+        "tier": pd.Categorical(rng.choice(["gold", "silver", "bronze"], 500)),
+        "amount": rng.random(500),
+    })
+    top = top_categories(df, top_k=2)
+    
+    assert set(top) == {"city", "tier"}
+    for col in top:
+        expected = df[col].value_counts().head(2)
+        assert top[col]["exact"] is True
+        assert top[col]["values"] == list(zip(expected.index, expected.values))
+    assert top["city"]["non_null"] == df["city"].notna().sum()
+    
+    limited = top_categories(df, top_k=2, max_columns=1)
+    assert list(limited) == ["city"]
+
+
+def test_top_categories_dictionary_codes():
+    """Test code-based counts for category and Arrow dictionary columns."""
+    pa = pytest.importorskip("pyarrow")
+    chunks = pa.chunked_array([
+        pa.array(["x", "y", None, "x"]).dictionary_encode(),
+        pa.array(["z", "x"]).dictionary_encode(),
+    ])
+    df = pd.DataFrame({
+        "dict": pd.arrays.ArrowExtensionArray(chunks),
+        "cat": pd.Categorical(["b", "a", "b", None, "b", "a"], categories=["a", "b", "c"]),
+    })
+    assert categorical_columns(df) == ["dict", "cat"]
+    
+    counter = TopKCounter(top_k=2, exact_limit=None)
+    counter.update(df.iloc[:3])
+    counter.update(df.iloc[3:])
+    result = counter.result()
+    assert result["dict"]["values"] == [("x", 3), ("y", 1)]
+    assert result["dict"]["non_null"] == 5
+    assert result["cat"]["values"] == [("b", 3), ("a", 2)]
+
+
+def test_top_k_counter_chunks_and_sketch():
+    """Test chunked counting and the heavy-hitter fallback."""
+    rng = np.random.default_rng(1)
+    values = np.concatenate([
+        np.repeat(["hot", "warm"], [3000, 1500]),
+        np.arange(20_000).astype(str),
+    ])
+    df = pd.DataFrame({"key": rng.permutation(values)})
+    
+    exact = TopKCounter(top_k=2)
+    sketched = TopKCounter(top_k=2, exact_limit=1000)
+    for start in range(0, len(df), 5000):
+        exact.update(df.iloc[start:start + 5000])
+        sketched.update(df.iloc[start:start + 5000])
+    
+    assert exact.result()["key"]["values"] == [("hot", 3000), ("warm", 1500)]
+    
+    result = sketched.result()["key"]
+    assert result["exact"] is False
+    assert [value for value, _ in result["values"]] == ["hot", "warm"]
+    for (_, count), true_count in zip(result["values"], [3000, 1500]):
+        assert true_count <= count <= true_count + result["error_bound"]
+
+
+def test_count_min_sketch():
+    """Test that Count-Min estimates never undercount."""
+    series = pd.Series(["a"] * 50 + ["b"] * 5 + [str(i) for i in range(1000)])
+    sketch = CountMinSketch(width_bits=8)
+    sketch.add(hash_column(series))
+    
+    estimates = sketch.estimate(hash_column(pd.Series(["a", "b"])))
+    assert estimates[0] >= 50
+    assert estimates[1] >= 5
+    assert sketch.total == len(series)
+
+
+def test_top_categories_exact_for_many_values():
+    """Test that in-memory counts stay exact beyond the sketch limit."""
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame({"hi": rng.integers(0, 150_000, 200_000).astype(str)})
+    expected = df["hi"].value_counts().head(3)
+    
+    top = top_categories(df, top_k=3)["hi"]
+    assert top["exact"] is True
+    assert [count for _, count in top["values"]] == list(expected.values)
+
+
+def test_hash_column_paths_agree():
+    """Test that repeated and high-cardinality strings hash alike."""
+    repeated = pd.Series(["a", "b"] * 1000)
+    unique = pd.Series([str(i) for i in range(2000)] + ["a", "b"])
+    
+    for series in (repeated, unique):
+        expected = pd.util.hash_pandas_object(series, index=False).to_numpy()
+        np.testing.assert_array_equal(hash_column(series), expected)